@@ -7,11 +7,13 @@ CRUD operations on the user model.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import NoReturn
 
-from sqlalchemy import insert, select
-from sqlalchemy.exc import IntegrityError, NoResultFound
-from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from sqlalchemy import bindparam, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.helpers.exceptions import (
     DuplicateUserError,
@@ -22,16 +24,57 @@ from app.auth.schemas import UserRegisterInput
 from config.base import logger
 
 
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    """Detached, immutable snapshot of the user columns needed for authentication."""
+
+    id: int
+    username: str
+    email: str
+    hashed_password: str
+    is_active: bool
+
+
+# Statements are built once at import time so the engine's compiled cache is hit
+# without reconstructing the SQL expression on every call.
+# Conflicts on either unique column insert nothing and return no row, instead of
+# aborting the transaction with an integrity error that must be rolled back.
+_INSERT_USER_STMT = pg_insert(User).on_conflict_do_nothing().returning(User)
+_GET_CONFLICTING_USERNAME_STMT = (
+    select(User.username)
+    .where(
+        or_(User.username == bindparam("username"), User.email == bindparam("email"))
+    )
+    .limit(1)
+)
+# Only the snapshot columns are selected, in `UserSnapshot` field order, so rows are
+# returned as plain tuples rather than hydrated into identity-mapped ORM instances.
+_GET_USER_BY_EMAIL_STMT = select(
+    User.id, User.username, User.email, User.hashed_password, User.is_active
+).where(
+    User.email == bindparam("email"),
+    User.is_active.is_(True),
+)
+
+
+# PostgreSQL SQLSTATE for `unique_violation`, and the messages per unique constraint.
+_UNIQUE_VIOLATION = "23505"
+_DUPLICATE_USER_MESSAGES = {
+    "auth__user_username_key": "User with this username already exists",
+    "auth__user_email_key": "User with this email already exists",
+}
+
+
 class AuthDataAccessLayer:
     """Data access layer for auth related operations."""
 
-    def __init__(self, db_session: async_scoped_session[AsyncSession]) -> None:
+    def __init__(self, db_session: AsyncSession) -> None:
         """
         Initialize the AuthDataAccessLayer.
 
         Parameters
         ----------
-        db_session : async_scoped_session[AsyncSession]
+        db_session : AsyncSession
             The database session for asynchronous operations.
         """
         self.db_session = db_session
@@ -53,27 +96,56 @@ class AuthDataAccessLayer:
         -------
         User
             The newly created user.
+
+        Raises
+        ------
+        DuplicateUserError
+            If a user with the same username or email already exists.
         """
-        stmt = (
-            insert(User)
-            .values(
-                username=user_input.username,
-                email=user_input.email,
-                hashed_password=hashed_password,
-                is_active=True,
-            )
-            .returning(User)
-        )
+        params = {
+            "username": user_input.username,
+            "email": user_input.email,
+            "hashed_password": hashed_password,
+            "is_active": True,
+        }
 
         async with self.db_session.begin():
             try:
-                result = await self.db_session.execute(stmt)
-                user = result.scalar_one()
+                result = await self.db_session.execute(_INSERT_USER_STMT, params)
+                user = result.scalar_one_or_none()
+                if user is None:
+                    await self.raise_duplicate_user_error(user_input=user_input)
                 return user
             except IntegrityError as exc:
                 await self.db_session.rollback()
                 self.handle_integrity_error(exc=exc)
 
+    async def raise_duplicate_user_error(
+        self, user_input: UserRegisterInput
+    ) -> NoReturn:
+        """
+        Raise the duplicate user error matching the existing, conflicting user.
+
+        Parameters
+        ----------
+        user_input : UserRegisterInput
+            User data that conflicted with an existing user.
+
+        Raises
+        ------
+        DuplicateUserError
+            Always, naming the username or the email as the duplicate field.
+        """
+        result = await self.db_session.execute(
+            _GET_CONFLICTING_USERNAME_STMT,
+            {"username": user_input.username, "email": user_input.email},
+        )
+        if result.scalar_one_or_none() == user_input.username:
+            raise DuplicateUserError(
+                _DUPLICATE_USER_MESSAGES["auth__user_username_key"]
+            )
+        raise DuplicateUserError(_DUPLICATE_USER_MESSAGES["auth__user_email_key"])
+
     @staticmethod
     def handle_integrity_error(exc: IntegrityError) -> NoReturn:
         """
@@ -84,22 +156,27 @@ class AuthDataAccessLayer:
         DuplicateUserError
             If the error is due to a duplicate username or email.
         """
-        if "duplicate key value violates unique constraint" in str(exc):
-            if "auth__user_username_key" in str(exc):
-                raise DuplicateUserError(
-                    "User with this username already exists"
-                ) from exc
-            elif "auth__user_email_key" in str(exc):
-                raise DuplicateUserError("User with this email already exists") from exc
+        # The asyncpg adapter exposes the SQLSTATE directly, while the constraint name
+        # lives on the original asyncpg exception it wraps.
+        orig = exc.orig
+        if orig is not None and getattr(orig, "sqlstate", None) == _UNIQUE_VIOLATION:
+            constraint_name = getattr(orig, "constraint_name", None) or getattr(
+                orig.__cause__, "constraint_name", None
+            )
+            if isinstance(constraint_name, str):
+                message = _DUPLICATE_USER_MESSAGES.get(constraint_name)
+                if message is not None:
+                    raise DuplicateUserError(message) from exc
         logger.warning("Unhandled Integrity error occurred. The error: %s", exc)
         raise exc
 
-    async def get_user_by_email(self, email: str) -> User:
+    async def get_user_by_email(self, email: str) -> UserSnapshot:
         """
         Retrieve a user by their email address.
 
-        This method queries the database for a user with the given email address.
-        If no user is found, it handles the `NoResultFound` exception.
+        The user is read from the database on every call, never from a cache, so a
+        deactivation or a password change takes effect on the next login, on every
+        worker.
 
         Parameters
         ----------
@@ -108,35 +185,19 @@ class AuthDataAccessLayer:
 
         Returns
         -------
-        User
-            The user object associated with the given email.
+        UserSnapshot
+            A detached snapshot of the user associated with the given email.
 
         Raises
         ------
         UserDoesNotExistError
             If no user with the specified email exists in the database.
         """
-        stmt = select(User).where(
-            User.email == email,
-            User.is_active == True,  # noqa: E712
+        # A single read needs no explicit transaction block of its own.
+        result = await self.db_session.execute(
+            _GET_USER_BY_EMAIL_STMT, {"email": email}
         )
-
-        try:
-            async with self.db_session.begin():
-                result = await self.db_session.execute(stmt)
-                user = result.scalar_one()
-            return user
-        except NoResultFound as err:
-            self.handle_no_result_found_error(err)
-
-    @staticmethod
-    def handle_no_result_found_error(exc: NoResultFound) -> NoReturn:
-        """
-        Handle no result found error.
-
-        Raises
-        ------
-        NoResultFound
-            If the user is not found.
-        """
-        raise UserDoesNotExistError("User does not exists.")
+        row = result.one_or_none()
+        if row is None:
+            raise UserDoesNotExistError("User does not exists.")
+        return UserSnapshot(*row)
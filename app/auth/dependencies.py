@@ -3,21 +3,22 @@
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.services import AuthService, TokenService
 from toolkit.api.database import get_async_db_session
 
+# `TokenService` holds no per-request state, so a single instance is shared.
+_token_service = TokenService()
+
 
 async def get_auth_service(
-    db_session: Annotated[
-        async_scoped_session[AsyncSession], Depends(get_async_db_session)
-    ],
+    db_session: Annotated[AsyncSession, Depends(get_async_db_session)],
 ) -> AuthService:
     """Get `AuthService` dependency, injecting db session."""
     return AuthService(db_session=db_session)
 
 
 async def get_token_service() -> TokenService:
-    """Get `TokenService` dependency."""
-    return TokenService()
+    """Get the shared `TokenService` dependency."""
+    return _token_service
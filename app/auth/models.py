@@ -1,6 +1,6 @@
 """Module containing model definitions for user."""
 
-from sqlalchemy import Index, sql
+from sqlalchemy import Index, sql, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from toolkit.database.annotations import str255
@@ -15,7 +15,13 @@ class User(CommonMixin, Base):
     __tablename__ = "auth__user"
     __table_args__ = (
         Index("ix_user_username", "username"),
-        Index("ix_user_email", "email"),
+        # Authentication only looks up active users; `email` uniqueness itself is
+        # enforced by the column's unique constraint.
+        Index(
+            "ix_user_email_active",
+            "email",
+            postgresql_where=text("is_active IS true"),
+        ),
     )
 
     # Columns
@@ -39,16 +45,6 @@ class User(CommonMixin, Base):
         comment="Indicates if the user is active",
     )
 
-    def __str__(self) -> str:
-        """Return a string representation of the User object."""
-        return (
-            f"<User(username={self.username}, email={self.email}, "
-            f"is_active={self.is_active})>"
-        )
-
     def __repr__(self) -> str:
-        """Return a human-readable string representation of the User object."""
-        return (
-            f"User(username={self.username}, email={self.email}, "
-            f"is_active={self.is_active})"
-        )
+        """Return a minimal string representation of the User object, free of PII."""
+        return f"User(id={self.id!r})"
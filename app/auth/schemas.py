@@ -2,16 +2,36 @@
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
+import re
 from typing import Annotated, Literal
 
-import pydantic
-from pydantic import EmailStr, Field
+from pydantic import AfterValidator, EmailStr, Field, field_validator
 
 from toolkit.api.schemas.base import APIResponse, BaseSchema
 from toolkit.api.schemas.mixins import CommonMixins
 
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _validate_email(value: str) -> str:
+    """
+    Check that the value is shaped like an email address.
+
+    A cheap syntactic check for login, where the email is only used for a lookup;
+    the full `email-validator` check is kept for registration. The address is
+    lowercased, matching how registered emails are stored.
+    """
+    if _EMAIL_RE.match(value) is None:
+        raise ValueError("value is not a valid email address")
+    return value.lower()
+
+
+LoginEmail = Annotated[
+    str,
+    AfterValidator(_validate_email),
+    Field(json_schema_extra={"format": "email"}),
+]
+
 
 class UserRegisterInput(BaseSchema):
     """Input schema for creating a new user."""
@@ -20,11 +40,17 @@ class UserRegisterInput(BaseSchema):
     email: Annotated[EmailStr, Field(description="Unique email address")]
     password: Annotated[str, Field(description="Raw password provided by the client")]
 
+    @field_validator("email")
+    @classmethod
+    def lowercase_email(cls, value: str) -> str:
+        """Lowercase the email, so each address has a single stored form."""
+        return value.lower()
+
 
 class UserAuthenticateInput(BaseSchema):
     """Input schema for user login."""
 
-    email: Annotated[EmailStr, Field(description="Unique email address")]
+    email: Annotated[LoginEmail, Field(description="Unique email address")]
     password: Annotated[str, Field(description="Raw password provided by the client")]
 
 
@@ -42,19 +68,6 @@ class UserOutput(APIResponse):
     data: UserOutputData
 
 
-@pydantic.dataclasses.dataclass
-class JwtClaims:
-    """Pydantic dataclass representing JWT claims."""
-
-    sub: str
-    aud: list[str] | str
-    iat: datetime
-    nbf: datetime
-    exp: datetime
-    jti: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    issue: str = "rental_house_fastapi"
-
-
 class TokenOutput(BaseSchema):
     """Output schema for granting user an access token with the token type."""
 
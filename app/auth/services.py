@@ -4,16 +4,20 @@ Module for user service operations.
 This module provides a service class for handling various user-related operations.
 """
 
-from dataclasses import asdict
-from datetime import datetime, timedelta, timezone
+import functools
+import secrets
+import time
 from typing import Any
 
 import bcrypt
 import jwt
+import orjson
 from fastapi.concurrency import run_in_threadpool
-from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from jwt.algorithms import get_default_algorithms
+from jwt.utils import base64url_encode
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.dal import AuthDataAccessLayer
+from app.auth.dal import AuthDataAccessLayer, UserSnapshot
 from app.auth.helpers.exceptions import (
     InternalTokenError,
     InvalidUserCredentials,
@@ -21,49 +25,82 @@ from app.auth.helpers.exceptions import (
 )
 from app.auth.helpers.messages import AuthMessages
 from app.auth.models import User
-from app.auth.schemas import JwtClaims, UserAuthenticateInput, UserRegisterInput
+from app.auth.schemas import UserAuthenticateInput, UserRegisterInput
 from config.base import logger, settings
 from toolkit.api.enums import HTTPStatusDoc, Status
 from toolkit.api.exceptions.custom_exceptions import UnauthorizedError
 
+# The bcrypt work factor, resolved once instead of on every hashing call.
+_BCRYPT_ROUNDS = settings.bcrypt_rounds
+
+
+@functools.cache
+def _get_dummy_hash() -> str:
+    """
+    Get a bcrypt hash, with the configured work factor, that matches no user.
+
+    Computed on first use rather than at import, since hashing is deliberately slow.
+
+    Returns
+    -------
+    str
+        The dummy hashed password.
+    """
+    salt = bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
+    return bcrypt.hashpw(secrets.token_hex(16).encode("utf-8"), salt).decode("utf-8")
+
+
+# The JWT keys are parsed once by the settings validators; PyJWT uses key objects as
+# is, so they are hoisted here instead of being looked up on the settings per token.
+_SIGNING_KEY = settings.jwt_private_key
+_VERIFYING_KEY = settings.jwt_public_key
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_LIFETIME_SECONDS = settings.jwt_lifetime_minutes * 60
+_JWT_AUDIENCE = ["all"]
+_JWT_ISSUE = "rental_house_fastapi"
+
+# Tokens are signed directly with PyJWT's algorithm object; the header never changes,
+# so its encoded segment is computed once.
+_JWT_SIGNER = get_default_algorithms()[_JWT_ALGORITHM]
+_JWT_HEADER_SEGMENT = base64url_encode(
+    orjson.dumps({"alg": _JWT_ALGORITHM, "typ": "JWT"})
+)
+
 
 class TokenService:
     """Service class for token-related operations."""
 
     TOKEN_TYPE = "Bearer"
 
-    def grant_token(self, user: User) -> dict[str, str]:
+    def grant_token(self, user: User | UserSnapshot) -> dict[str, str]:
         """
         Generate and return a JWT access token for the specified user.
 
         Parameters
         ----------
-        user : User
+        user : User | UserSnapshot
             The user for whom the token is being generated.
 
         Returns
         -------
         dict[str, str]
-            A dictionary containing the access token and token type.
+            A dictionary containing the access token and token type, keyed by the
+            camelCase aliases of `TokenOutput`.
 
         Raises
         ------
         TokenError
             If an internal error occurs during token encoding.
         """
-        assert settings.jwt_private_key is not None, "JWT private key is not set."
+        assert _SIGNING_KEY is not None, "JWT private key is not set."
         payload = self._generate_payload(user=user)
         try:
-            token = jwt.encode(
-                payload=asdict(payload),
-                key=settings.jwt_private_key,
-                algorithm=settings.jwt_algorithm,
-            )
+            token = self._encode(payload=payload)
         except TypeError as err:
             logger.error("Couldn't encode the jwt.", exc_info=True)
             raise InternalTokenError(AuthMessages.INTERNAL_TOKEN_ERROR) from err
 
-        return {"access_token": token, "type": self.TOKEN_TYPE}
+        return {"accessToken": token, "type": self.TOKEN_TYPE}
 
     def verify_token(self, token: str) -> None:
         """
@@ -81,14 +118,14 @@ class TokenService:
         InternalTokenError
             If an internal error occurs during token verification.
         """
-        assert settings.jwt_public_key is not None, "JWT public key is not set."
+        assert _VERIFYING_KEY is not None, "JWT public key is not set."
 
         try:
             jwt.decode(
                 jwt=token,
-                key=settings.jwt_public_key,
-                algorithms=[settings.jwt_algorithm],
-                audience=["all"],
+                key=_VERIFYING_KEY,
+                algorithms=[_JWT_ALGORITHM],
+                audience=_JWT_AUDIENCE,
                 options={"verify_signature": True, "verify_exp": True},
             )
         except jwt.ExpiredSignatureError:
@@ -103,74 +140,73 @@ class TokenService:
             )
             raise InternalTokenError(AuthMessages.INTERNAL_TOKEN_ERROR)
 
-    def _generate_payload(self, user: User) -> JwtClaims:
+    @staticmethod
+    def _encode(payload: dict[str, Any]) -> str:
         """
-        Generate the payload for a JWT token.
+        Encode and sign a JWT from trusted claims.
+
+        This is the compact JWS serialization `jwt.encode` produces, without its
+        per-call header assembly, algorithm lookup, and key preparation. The claims
+        are serialized with `orjson`, which also yields compact output.
 
         Parameters
         ----------
-        user : User
-            The user for whom the token payload is being generated.
+        payload : dict[str, Any]
+            The JWT claims to encode.
 
         Returns
         -------
-        JwtClaims
-            A dataclass instance representing the JWT claims.
-        """
-        current_datetime = self._get_current_datetime()
-        expiration_datetime = self._add_timedelta(
-            dtm=current_datetime, minutes=settings.jwt_lifetime_minutes
-        )
-        return JwtClaims(
-            sub=str(user.id),
-            aud=["all"],
-            iat=current_datetime,
-            nbf=current_datetime,
-            exp=expiration_datetime,
-        )
+        str
+            The signed JWT.
 
-    @staticmethod
-    def _get_current_datetime() -> datetime:
+        Raises
+        ------
+        TypeError
+            If the claims are not JSON serializable (`orjson.JSONEncodeError`).
         """
-        Get the current datetime in UTC.
+        payload_segment = base64url_encode(orjson.dumps(payload))
+        signing_input = _JWT_HEADER_SEGMENT + b"." + payload_segment
+        signature = _JWT_SIGNER.sign(signing_input, _SIGNING_KEY)
+        return (signing_input + b"." + base64url_encode(signature)).decode()
 
-        Returns
-        -------
-        datetime
-            The current datetime in UTC.
+    def _generate_payload(self, user: User | UserSnapshot) -> dict[str, Any]:
         """
-        return datetime.now(timezone.utc)
+        Generate the payload for a JWT token.
 
-    @staticmethod
-    def _add_timedelta(dtm: datetime, minutes: int) -> datetime:
-        """
-        Add a timedelta to a given datetime object.
+        The time claims are integer epoch seconds, which PyJWT encodes as is.
 
         Parameters
         ----------
-        dtm : datetime
-            The datetime object to which the timedelta will be added.
-        minutes : int
-            The number of minutes to add.
+        user : User | UserSnapshot
+            The user for whom the token payload is being generated.
 
         Returns
         -------
-        datetime
-            A new datetime object with the added timedelta.
+        dict[str, Any]
+            A dictionary representing the JWT claims.
         """
-        return dtm + timedelta(minutes=minutes)
+        now = int(time.time())
+        return {
+            "sub": str(user.id),
+            "aud": _JWT_AUDIENCE,
+            "iat": now,
+            "nbf": now,
+            "exp": now + _JWT_LIFETIME_SECONDS,
+            "jti": secrets.token_hex(16),
+            "issue": _JWT_ISSUE,
+        }
 
 
 class AuthService:
     """Service class for user-related operations."""
 
-    def __init__(self, db_session: async_scoped_session[AsyncSession]) -> None:
+    def __init__(self, db_session: AsyncSession) -> None:
         """
         Initialize the AuthService.
 
         Parameters
         ----------
-        db_session : async_scoped_session[AsyncSession]
+        db_session : AsyncSession
             The database session for asynchronous operations.
         """
         self.db_session = db_session
@@ -193,7 +229,7 @@ class AuthService:
         -------
         dict[str, Any]
             The newly registered user as the data, plus other metadata related to the
-            user registration.
+            user registration, keyed by the camelCase aliases of `UserOutput`.
         """
         # Perform password hashing in a separate thread, making event loop responsive
         hashed_password = await run_in_threadpool(
@@ -206,7 +242,14 @@ class AuthService:
         return {
             "status": Status.CREATED,
             "message": AuthMessages.SUCCESS_REGISTER_MESSAGE,
-            "data": user,
+            "data": {
+                "createdAt": user.created_at,
+                "modifiedAt": user.modified_at,
+                "id": user.id,
+                "username": user.username,
+                "email": user.email,
+                "isActive": user.is_active,
+            },
             "documentationLink": HTTPStatusDoc.HTTP_STATUS_201,
         }
 
@@ -238,21 +281,62 @@ class AuthService:
         try:
             user = await self.user_dal.get_user_by_email(email=user_input.email)
         except UserDoesNotExistError:
+            # Spend the same bcrypt work as for a real user, so response timing
+            # doesn't reveal which emails are registered.
+            await run_in_threadpool(self._check_dummy_password, user_input.password)
             raise InvalidUserCredentials(AuthMessages.INVALID_CREDENTIALS)
 
-        is_password_valid = self.check_password(
-            password=user_input.password, hashed_password=user.hashed_password
+        # Perform password checking and token signing, both CPU-bound, in a single
+        # separate thread, making event loop responsive
+        token = await run_in_threadpool(
+            self._verify_and_grant, user_input.password, user
         )
-        if not is_password_valid:
+        if token is None:
             raise InvalidUserCredentials(AuthMessages.INVALID_CREDENTIALS)
 
+        return token
+
+    def _verify_and_grant(
+        self, password: str, user: UserSnapshot
+    ) -> dict[str, str] | None:
+        """
+        Check the user's password and, if it matches, grant an access token.
+
+        Parameters
+        ----------
+        password : str
+            The plaintext password provided by the client.
+        user : UserSnapshot
+            The user the password is checked against.
+
+        Returns
+        -------
+        dict[str, str] | None
+            The granted token, or None if the password doesn't match.
+        """
+        if not self.check_password(password, user.hashed_password):
+            return None
         return self.token_service.grant_token(user=user)
 
-    def hash_password(self, password: str) -> str:
+    @classmethod
+    def _check_dummy_password(cls, password: str) -> None:
+        """
+        Check a password against a dummy hash, discarding the result.
+
+        Parameters
+        ----------
+        password : str
+            The plaintext password provided by the client.
+        """
+        cls.check_password(password, _get_dummy_hash())
+
+    @staticmethod
+    def hash_password(password: str) -> str:
         """
         Hash the user's password.
 
-        This method generates a salt and hashes the password using bcrypt.
+        This method generates a salt, using the work factor configured by the
+        `bcrypt_rounds` setting, and hashes the password using bcrypt.
 
         Parameters
         ----------
@@ -264,14 +348,15 @@ class AuthService:
         str
             The hashed password.
         """
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
         hashed_password = bcrypt.hashpw(
             password=password.encode("utf-8"),
             salt=salt,
         )
         return hashed_password.decode("utf-8")
 
-    def check_password(self, password: str, hashed_password: str) -> bool:
+    @staticmethod
+    def check_password(password: str, hashed_password: str) -> bool:
         """
         Check if a plaintext password matches a hashed password.
 
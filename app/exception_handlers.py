@@ -1,9 +1,10 @@
 """Module containing custom exception handlers for FastAPI applications."""
 
 import fastapi
+import orjson
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import Response
 
 from config.base import logger
 from toolkit.api.enums import HTTPStatusDoc, Messages, Status
@@ -11,13 +12,82 @@ from toolkit.api.exceptions import (
     CustomHTTPException,
     DoesNotExistError,
     DuplicateResourceError,
+    HTTPErrorDetails,
     UnauthorizedError,
 )
 
+# Status codes, statuses, and documentation links of each handled error, bound
+# once so the handlers don't resolve them on every call.
+_HTTP_401 = fastapi.status.HTTP_401_UNAUTHORIZED
+_HTTP_404 = fastapi.status.HTTP_404_NOT_FOUND
+_HTTP_409 = fastapi.status.HTTP_409_CONFLICT
+_HTTP_422 = fastapi.status.HTTP_422_UNPROCESSABLE_ENTITY
+_HTTP_500 = fastapi.status.HTTP_500_INTERNAL_SERVER_ERROR
+_STATUS_UNAUTHORIZED = Status.UNAUTHORIZED
+_STATUS_NOT_FOUND = Status.NOT_FOUND
+_STATUS_CONFLICT = Status.CONFLICT
+_STATUS_VALIDATION_ERROR = Status.VALIDATION_ERROR
+_DOC_401 = HTTPStatusDoc.HTTP_STATUS_401
+_DOC_404 = HTTPStatusDoc.HTTP_STATUS_404
+_DOC_409 = HTTPStatusDoc.HTTP_STATUS_409
+_DOC_422 = HTTPStatusDoc.HTTP_STATUS_422
+
+# The internal error response never varies, so its body is serialized once.
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    {
+        "status": Status.ERROR,
+        "message": Messages.INTERNAL_SERVER_ERROR,
+        "documentationLink": HTTPStatusDoc.HTTP_STATUS_500,
+    }
+)
+
+
+def _error_response(
+    *,
+    status_code: int,
+    status: Status,
+    message: str,
+    details: HTTPErrorDetails | None,
+    documentation_link: HTTPStatusDoc,
+) -> Response:
+    """
+    Build the JSON error response shared by the exception handlers.
+
+    Parameters
+    ----------
+    status_code : int
+        The HTTP status code of the response.
+    status : Status
+        The status describing the error.
+    message : str
+        A concise description of the error.
+    details : HTTPErrorDetails or None
+        The field and reason of the error, if any.
+    documentation_link : HTTPStatusDoc
+        The link to the documentation of the HTTP status code.
+
+    Returns
+    -------
+    Response
+        The serialized error response.
+    """
+    # orjson serializes the enum members and the details dataclass natively.
+    body = orjson.dumps(
+        {
+            "status": status,
+            "message": message,
+            "details": details,
+            "documentationLink": documentation_link,
+        }
+    )
+    return Response(
+        content=body, status_code=status_code, media_type="application/json"
+    )
+
 
 async def custom_http_exception_handler(
     request: Request, exc: CustomHTTPException
-) -> ORJSONResponse:
+) -> Response:
     """
     Handle CustomHTTPException raised within FastAPI routes.
 
@@ -30,30 +100,26 @@ async def custom_http_exception_handler(
 
     Returns
     -------
-    ORJSONResponse
+    Response
         JSON response containing error details, including status code,
         error message, details, and documentation link if available.
     """
-    return ORJSONResponse(
+    return _error_response(
         status_code=exc.status_code,
-        content={
-            "status": exc.status.value,
-            "message": exc.message,
-            "details": exc.details,
-            "documentationLink": exc.documentation_link.value,
-        },
+        status=exc.status,
+        message=exc.message,
+        details=exc.details,
+        documentation_link=exc.documentation_link,
     )
 
 
-async def internal_exception_handler(
-    request: Request, exc: Exception
-) -> ORJSONResponse:
+async def internal_exception_handler(request: Request, exc: Exception) -> Response:
     """
-    Handle unexpected internal server errors by raising a CustomHTTPException.
+    Handle unexpected internal server errors by returning a generic error response.
 
     This function is an exception handler for any general Python exceptions
     that may arise within FastAPI routes. It catches unhandled exceptions and
-    raises a CustomHTTPException with a status code of 500 (Internal Server Error),
+    returns a response with a status code of 500 (Internal Server Error),
     providing a generic error message and documentation link.
 
     Parameters
@@ -63,32 +129,28 @@ async def internal_exception_handler(
     exc : Exception
         The general Python exception instance raised.
 
-    Raises
-    ------
-    CustomHTTPException
-        Always raises a CustomHTTPException with a status code of 500
-        (Internal Server Error).
+    Returns
+    -------
+    Response
+        JSON error response with a status code of 500 (Internal Server Error).
     """
     logger.error("Handle general base python exception. Exception details: %s", exc)
-    return ORJSONResponse(
-        status_code=fastapi.status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "status": Status.ERROR,
-            "message": Messages.INTERNAL_SERVER_ERROR,
-            "documentationLink": HTTPStatusDoc.HTTP_STATUS_500,
-        },
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
+        status_code=_HTTP_500,
+        media_type="application/json",
     )
 
 
 async def request_validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> None:
+) -> Response:
     """
-    Handle RequestValidationError by raising a CustomHTTPException with details.
+    Handle RequestValidationError by returning an error response with details.
 
     This function is an exception handler specifically designed to handle
     RequestValidationError exceptions raised within FastAPI routes.
-    It raises a CustomHTTPException with a status code of 422 (Unprocessable Entity)
+    It returns a JSON response with a status code of 422 (Unprocessable Entity)
     and includes details such as the error message, reason, affected field,
     and a documentation link.
 
@@ -99,37 +161,35 @@ async def request_validation_exception_handler(
     exc : RequestValidationError
         The instance of RequestValidationError raised.
 
-    Raises
-    ------
-    CustomHTTPException
-        Always raises a CustomHTTPException with a status code of 422
-        (Unprocessable Entity).
+    Returns
+    -------
+    Response
+        JSON error response with a status code of 422 (Unprocessable Entity).
     """
     exc_data = exc.errors()[0]
-    message = exc.errors()[0]["msg"]
-    reason = exc.errors()[0]["type"]
+    message = exc_data["msg"]
+    reason = exc_data["type"]
     field = exc_data["loc"][1] if len(exc_data["loc"]) >= 2 else "-"
     loc = exc_data["loc"][0]
     logger.error("Handle request validation exception. Exception details: %s", exc_data)
-    raise CustomHTTPException(
-        status_code=fastapi.status.HTTP_422_UNPROCESSABLE_ENTITY,
-        status=Status.VALIDATION_ERROR,
+    return _error_response(
+        status_code=_HTTP_422,
+        status=_STATUS_VALIDATION_ERROR,
         message=message,
-        field=f"{field}, in: {loc}",
-        reason=reason,
-        documentation_link=HTTPStatusDoc.HTTP_STATUS_422,
-    ) from exc
+        details=HTTPErrorDetails(f"{field}, in: {loc}", reason),
+        documentation_link=_DOC_422,
+    )
 
 
 async def unauthorized_exception_handler(
     request: Request, exc: UnauthorizedError
-) -> None:
+) -> Response:
     """
-    Handle UnauthorizedError by raising a CustomHTTPException with details.
+    Handle UnauthorizedError by returning an error response with details.
 
     This function is an exception handler specifically designed to handle
     UnauthorizedError exceptions raised within FastAPI routes.
-    It raises a CustomHTTPException with a status code of 401 (Unauthorized)
+    It returns a JSON response with a status code of 401 (Unauthorized)
     and includes details such as the error message, reason, affected field,
     and a documentation link.
 
@@ -140,29 +200,30 @@ async def unauthorized_exception_handler(
     exc : UnauthorizedError
         The instance of UnauthorizedError raised.
 
-    Raises
-    ------
-    CustomHTTPException
-        Always raises a CustomHTTPException with a status code of 401 (Unauthorized).
+    Returns
+    -------
+    Response
+        JSON error response with a status code of 401 (Unauthorized).
     """
     logger.error("Handled unauthorized error. Exception details: %s", exc)
-    raise CustomHTTPException(
-        status_code=fastapi.status.HTTP_401_UNAUTHORIZED,
-        status=Status.UNAUTHORIZED,
+    return _error_response(
+        status_code=_HTTP_401,
+        status=_STATUS_UNAUTHORIZED,
         message=str(exc),
-        documentation_link=HTTPStatusDoc.HTTP_STATUS_401,
-    ) from exc
+        details=None,
+        documentation_link=_DOC_401,
+    )
 
 
 async def does_not_exist_exception_handler(
     request: Request, exc: DoesNotExistError
-) -> None:
+) -> Response:
     """
-    Handle DoesNotExistError by raising a CustomHTTPException with details.
+    Handle DoesNotExistError by returning an error response with details.
 
     This function is an exception handler specifically designed to handle
     DoesNotExistError exceptions and its children raised within FastAPI routes.
-    It raises a CustomHTTPException with a status code of 404 (Not Found)
+    It returns a JSON response with a status code of 404 (Not Found)
     and includes details such as the error message, reason, affected field,
     and a documentation link.
 
@@ -173,29 +234,30 @@ async def does_not_exist_exception_handler(
     exc : DoesNotExistError
         The instance of DoesNotExistError raised.
 
-    Raises
-    ------
-    CustomHTTPException
-        Always raises a CustomHTTPException with a status code of 404 (Not Found).
+    Returns
+    -------
+    Response
+        JSON error response with a status code of 404 (Not Found).
     """
     logger.error("Handled does not exist exception. Exception details: %s", exc)
-    raise CustomHTTPException(
-        status_code=fastapi.status.HTTP_404_NOT_FOUND,
-        status=Status.NOT_FOUND,
+    return _error_response(
+        status_code=_HTTP_404,
+        status=_STATUS_NOT_FOUND,
         message=str(exc),
-        documentation_link=HTTPStatusDoc.HTTP_STATUS_404,
-    ) from exc
+        details=None,
+        documentation_link=_DOC_404,
+    )
 
 
 async def duplicate_resource_error_handler(
     request: Request, exc: DuplicateResourceError
-) -> None:
+) -> Response:
     """
-    Handle DuplicateResourceError by raising a CustomHTTPException with details.
+    Handle DuplicateResourceError by returning an error response with details.
 
     This function is an exception handler specifically designed to handle
     DuplicateResourceError exceptions raised within FastAPI routes.
-    It raises a CustomHTTPException with a status code of 409 (Conflict)
+    It returns a JSON response with a status code of 409 (Conflict)
     and includes details such as the error message, reason, affected field,
     and a documentation link.
 
@@ -206,15 +268,16 @@ async def duplicate_resource_error_handler(
     exc : DuplicateResourceError
         The instance of DuplicateResourceError raised.
 
-    Raises
-    ------
-    CustomHTTPException
-        Always raises a CustomHTTPException with a status code of 409 (Conflict).
+    Returns
+    -------
+    Response
+        JSON error response with a status code of 409 (Conflict).
     """
     logger.error("Handle duplicate resource exception. Exception details: %s", exc)
-    raise CustomHTTPException(
-        status_code=fastapi.status.HTTP_409_CONFLICT,
-        status=Status.CONFLICT,
+    return _error_response(
+        status_code=_HTTP_409,
+        status=_STATUS_CONFLICT,
         message=str(exc),
-        documentation_link=HTTPStatusDoc.HTTP_STATUS_409,
-    ) from exc
+        details=None,
+        documentation_link=_DOC_409,
+    )
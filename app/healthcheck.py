@@ -1,16 +1,57 @@
 """Module provides a health check endpoint for the FastAPI application."""
 
-from typing import Any
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import NoReturn
 
-from fastapi import APIRouter, status
+import orjson
+from fastapi import APIRouter, Response, status
 from pydantic import BaseModel
 
-from config.base import db, redis_manager
+from config.base import db, logger, redis_manager, settings
 from toolkit.api.enums import HTTPStatusDoc, Status
 from toolkit.api.exceptions import CustomHTTPException
 
 router = APIRouter(prefix="/health-check", tags=["Health Check"])
 
+# The healthy response never varies, so its body is serialized once.
+_OK_BODY = orjson.dumps(
+    {"database": True, "redis": True, "message": "Everything is Fine!"}
+)
+
+# Results older than this are treated as a wedged probe, not as a healthy service.
+_HEALTH_STATUS_MAX_AGE_SECONDS = 2 * settings.health_check_interval_seconds
+
+
+@dataclass(slots=True)
+class _HealthStatus:
+    """Last known availability of the backing services."""
+
+    database: bool = False
+    redis: bool = False
+    checked_at: float = float("-inf")  # `time.monotonic()` of the last probe
+
+
+_health_status = _HealthStatus()
+
+
+async def probe_health() -> None:
+    """Probe the database and Redis, and record the results."""
+    _health_status.database = await db.test_connection()
+    _health_status.redis = await redis_manager.test_connection()
+    _health_status.checked_at = time.monotonic()
+
+
+async def run_health_probe() -> NoReturn:
+    """Probe the backing services forever, at the configured interval."""
+    while True:
+        try:
+            await probe_health()
+        except Exception:
+            logger.error("Health probe failed unexpectedly.", exc_info=True)
+        await asyncio.sleep(settings.health_check_interval_seconds)
+
 
 class HealthCheckResponse(BaseModel):
     """
@@ -35,38 +76,44 @@ class HealthCheckResponse(BaseModel):
     status_code=status.HTTP_200_OK,
     description="Perform a health check on the service.",
 )
-async def check_health() -> Any:
+async def check_health() -> Response:
     """
     Perform a health check to ensure the database connection is available.
 
+    The status is read from the results of the background probe, so no I/O is done
+    on the request path.
+
     Returns
     -------
-    Any
-        JSON response indicating the health status of the database.
+    Response
+        JSON response indicating the health status of the database; a prebuilt
+        body that `response_model` only documents.
 
     Raises
     ------
     CustomHTTPException
-        If the database connection is not available, raises a 500 HTTP error.
+        If the database connection is not available, or the probe results are stale,
+        raises a 500 HTTP error.
     """
-    is_db_available = await db.test_connection()
-    if not is_db_available:
+    if time.monotonic() - _health_status.checked_at > _HEALTH_STATUS_MAX_AGE_SECONDS:
+        raise CustomHTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status=Status.FAILURE,
+            message="Health status is stale",
+            documentation_link=HTTPStatusDoc.HTTP_STATUS_500,
+        )
+    if not _health_status.database:
         raise CustomHTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             status=Status.FAILURE,
             message="Database not available",
             documentation_link=HTTPStatusDoc.HTTP_STATUS_500,
         )
-    is_redis_available = await redis_manager.test_connection()
-    if not is_redis_available:
+    if not _health_status.redis:
         raise CustomHTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             status=Status.FAILURE,
             message="Redis not available",
             documentation_link=HTTPStatusDoc.HTTP_STATUS_500,
         )
-    return {
-        "database": is_db_available,
-        "redis": is_redis_available,
-        "message": "Everything is Fine!",
-    }
+    return Response(content=_OK_BODY, media_type="application/json")
@@ -1,12 +1,15 @@
 """Module for setting lifespan context manager for FastAPI application."""
 
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi_limiter import FastAPILimiter
 
-from config.base import redis_manager
+from app.healthcheck import run_health_probe
+from app.threat.producer import threat_report_producer
+from config.base import db, logger, redis_manager
 
 
 @asynccontextmanager
@@ -14,5 +17,21 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
     """Set lifespan context manager for FastAPI application."""
     redis_connection = redis_manager.get_connection()
     await FastAPILimiter.init(redis=redis_connection)
+    if not await db.warm_up():
+        logger.warning("Couldn't warm up the database connection pool.")
+    if not await redis_manager.warm_up():
+        logger.warning("Couldn't warm up the Redis connection pool.")
+    try:
+        await threat_report_producer.connect()
+    except Exception:
+        # Publishing connects lazily, so the app can still start without RabbitMQ
+        logger.warning("Couldn't connect the threat report producer.", exc_info=True)
+    threat_report_producer.start()
+    health_probe_task = asyncio.create_task(run_health_probe())
     yield
+    health_probe_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await health_probe_task
+    await threat_report_producer.shutdown()
     await FastAPILimiter.close()
+    await db.close_engine()
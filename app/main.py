@@ -5,10 +5,9 @@ It initializes the FastAPI application, configures middleware, setting lifespan
 manager, and defines routes for handling various HTTP requests.
 """
 
-from fastapi import Depends, FastAPI
+from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
-from fastapi_limiter.depends import RateLimiter
 
 from config.base import settings
 from config.settings.openapi import responses
@@ -18,6 +17,7 @@ from toolkit.api.exceptions import (
     DuplicateResourceError,
     UnauthorizedError,
 )
+from toolkit.api.middlewares import RateLimitMiddleware
 
 from .auth.routers import router as auth_router
 from .exception_handlers import (
@@ -37,14 +37,26 @@ app = FastAPI(
     title=settings.openapi.title,
     version=settings.openapi.version,
     description=settings.openapi.description,
-    contact=settings.openapi.contact.model_dump(),
-    license_info=settings.openapi.license.model_dump(),
-    openapi_tags=[tag.model_dump() for tag in settings.openapi.tags],
+    contact=settings.openapi.contact_dict,
+    license_info=settings.openapi.license_dict,
+    openapi_tags=settings.openapi.tags_dict,
     responses=responses,
     default_response_class=ORJSONResponse,
     redoc_url=None,
     lifespan=lifespan,
-    dependencies=[Depends(RateLimiter(times=10, minutes=1))],
+)
+
+# Register middlewares
+app.add_middleware(
+    RateLimitMiddleware,
+    times=10,
+    minutes=1,
+    exclude_paths=(
+        health_check_router.prefix,
+        app.openapi_url,
+        app.docs_url,
+        app.swagger_ui_oauth2_redirect_url,
+    ),
 )
 
 # Register custom exception handlers
@@ -5,9 +5,7 @@ This module provides methods for interacting with the database to perform
 CRUD operations on the threat report model.
 """
 
-from sqlalchemy import insert, select
-from sqlalchemy.exc import NoResultFound
-from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.threat.helpers.exceptions import ThreatReportDoesNotExistsError
 from app.threat.models import ThreatReport
@@ -15,27 +13,22 @@ from app.threat.schemas import ThreatReportInputSchema
 
 
 class ThreatReportDataAccessLayer:
-    """Data access layer for threat report related operations."""
+    """
+    Data access layer for threat report related operations.
 
-    def __init__(self, db_session: async_scoped_session[AsyncSession]) -> None:
-        """
-        Initialize the `ThreatReportDataAccessLayer`.
-
-        Parameters
-        ----------
-        db_session : async_scoped_session[AsyncSession]
-            The database session for asynchronous operations.
-        """
-        self.db_session = db_session
+    The layer holds no state; the database session is passed to each method.
+    """
 
     async def create_threat_report(
-        self, threat_report_input: ThreatReportInputSchema
+        self, db_session: AsyncSession, threat_report_input: ThreatReportInputSchema
     ) -> ThreatReport:
         """
         Create a new threat report.
 
         Parameters
         ----------
+        db_session : AsyncSession
+            The database session for asynchronous operations.
         threat_report_input : ThreatReportInputSchema
             The input data for creating a new threat report.
 
@@ -44,22 +37,27 @@ class ThreatReportDataAccessLayer:
         ThreatReport
             The newly created threat report.
         """
-        stmt = (
-            insert(ThreatReport)
-            .values(**threat_report_input.model_dump())
-            .returning(ThreatReport)
-        )
+        # The input is flat and already validated, so its field values are read
+        # directly instead of taking a `model_dump()` pass through the serializer.
+        threat_report = ThreatReport(**dict(threat_report_input))
 
-        async with self.db_session.begin():
-            result = await self.db_session.execute(stmt)
-            return result.scalar_one()
+        # The unit of work inserts the row on flush, populating the identity map and
+        # fetching server-generated columns (id, created_at) via RETURNING.
+        async with db_session.begin():
+            db_session.add(threat_report)
+            await db_session.flush()
+        return threat_report
 
-    async def get_threat_report(self, threat_report_id: int) -> ThreatReport:
+    async def get_threat_report(
+        self, db_session: AsyncSession, threat_report_id: int
+    ) -> ThreatReport:
         """
         Retrieve a threat report by its ID.
 
         Parameters
         ----------
+        db_session : AsyncSession
+            The database session for asynchronous operations.
         threat_report_id : int
             The ID of the threat report to retrieve.
 
@@ -67,12 +65,15 @@ class ThreatReportDataAccessLayer:
         -------
         ThreatReport
             The threat report.
-        """
-        stmt = select(ThreatReport).where(ThreatReport.id == threat_report_id)
 
-        async with self.db_session.begin():
-            result = await self.db_session.execute(stmt)
-            try:
-                return result.scalar_one()
-            except NoResultFound:
-                raise ThreatReportDoesNotExistsError("Threat report not found")
+        Raises
+        ------
+        ThreatReportDoesNotExistsError
+            If no threat report with the given ID exists.
+        """
+        # The primary-key lookup checks the identity map before querying, and uses
+        # SQLAlchemy's cached PK loading plan instead of a freshly built SELECT.
+        threat_report = await db_session.get(ThreatReport, threat_report_id)
+        if threat_report is None:
+            raise ThreatReportDoesNotExistsError("Threat report not found")
+        return threat_report
@@ -1,18 +1,16 @@
 """Module containing dependencies for the threat API."""
 
-from typing import Annotated
-
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
-
+from app.threat.dal import ThreatReportDataAccessLayer
+from app.threat.producer import threat_report_producer
 from app.threat.services import ThreatReportService
-from toolkit.api.database import get_async_db_session
+
+# `ThreatReportService` holds no per-request state, so a single instance is shared.
+_threat_report_service = ThreatReportService(
+    threat_report_dal=ThreatReportDataAccessLayer(),
+    threat_report_producer=threat_report_producer,
+)
 
 
-async def get_threat_report_service(
-    db_session: Annotated[
-        async_scoped_session[AsyncSession], Depends(get_async_db_session)
-    ],
-) -> ThreatReportService:
-    """Get `ThreatReportService` dependency, injecting db session."""
-    return ThreatReportService(db_session=db_session)
+async def get_threat_report_service() -> ThreatReportService:
+    """Get the shared `ThreatReportService` dependency."""
+    return _threat_report_service
@@ -1,9 +1,8 @@
 """Module containing model definitions for threat reports."""
 
-import json
 from typing import Any
 
-from sqlalchemy import Index
+import orjson
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.threat.helpers.enums import ThreatType
@@ -17,10 +16,6 @@ class ThreatReport(CommonMixin, Base):
 
     # Table Configuration
     __tablename__ = "threat__threat_report"
-    __table_args__ = (
-        Index("idx_threat_report_created_at", "created_at"),
-        Index("idx_threat_report_modified_at", "modified_at"),
-    )
 
     # Columns
     indicator_type: Mapped[ThreatType] = mapped_column(
@@ -64,18 +59,29 @@ class ThreatReport(CommonMixin, Base):
         comment="The threat attack logs",
     )
 
-    def to_bytes(self) -> bytes:
-        """Convert the ThreatReport instance to a JSON bytes object."""
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the ThreatReport instance to a dictionary of its loaded columns.
 
-        def serializer(obj: Any) -> str:
-            if isinstance(obj, ThreatType):
-                return obj.value
-            return str(obj)
+        The column attributes are read from the instance state without triggering
+        lazy loads or touching relationships.
+        """
+        loaded = self.__dict__
+        return {
+            attr.key: loaded[attr.key]
+            for attr in self.__mapper__.column_attrs
+            if attr.key in loaded
+        }
+
+    def to_bytes(self) -> bytes:
+        """
+        Convert the ThreatReport instance to a JSON bytes object.
 
-        threat_dict = self.__dict__
-        threat_dict.pop("_sa_instance_state", None)
-        json_str = json.dumps(threat_dict, default=serializer)
-        return json_str.encode("utf-8")
+        Only the loaded column attributes are serialized, see `to_dict`. `orjson`
+        serializes the `ThreatType` members and the datetimes (as ISO 8601) natively,
+        and returns bytes directly.
+        """
+        return orjson.dumps(self.to_dict(), default=str)
 
     def __str__(self) -> str:
         """Return a string representation of the `ThreatReport` object."""
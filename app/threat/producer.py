@@ -1,51 +1,254 @@
 """Module handles the publishing of new threat_report messages to RabbitMQ exchange."""
 
+import asyncio
+from contextlib import suppress
+
+import orjson
 from aio_pika import DeliveryMode, ExchangeType, Message
-from aio_pika.abc import AbstractChannel, AbstractExchange
+from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractExchange
 
 from app.threat.models import ThreatReport
-from config.base import logger
+from config.base import logger, rabbitmq_manager, settings
 from config.rabbitmq import AsyncRabbitmqManager
 
 THREAT_REPORT_EXCHANGE_NAME = "threat_report_exchange"
+NEW_THREAT_REPORT_ROUTING_KEY = "threat_report.new"
+
+# Bound on messages awaiting publication, so a broker outage can't grow memory
+# without limit, the most messages published per confirm round-trip, how long a
+# batch waits for more messages once it has one, and how long shutdown waits for
+# the backlog to be published.
+_PUBLISH_QUEUE_MAXSIZE = 10_000
+_PUBLISH_BATCH_MAXSIZE = 100
+_PUBLISH_BATCH_LINGER_SECONDS = 0.005
+_SHUTDOWN_FLUSH_TIMEOUT_SECONDS = 5.0
+
+# Attack logs larger than this are left out of the message, keeping payloads far from
+# the broker's memory alarms; consumers fetch them from the stored report instead.
+_ATTACK_LOGS_CLAIM_CHECK_BYTES = 256 * 1024
+
+
+def _encode_threat_report_message(threat_report: ThreatReport) -> bytes:
+    """
+    Encode a threat report into a message body.
+
+    Oversized attack logs are replaced by `None`, with `attack_logs_omitted` set, so
+    the report in the database acts as the claim check for them.
+
+    Parameters
+    ----------
+    threat_report : ThreatReport
+        The threat report object to be serialized.
+
+    Returns
+    -------
+    bytes
+        The serialized threat report.
+    """
+    attack_logs = threat_report.attack_logs
+    # A character is at most 4 bytes in UTF-8, so short logs skip the encoding.
+    if (
+        attack_logs is None
+        or len(attack_logs) * 4 <= _ATTACK_LOGS_CLAIM_CHECK_BYTES
+        or len(attack_logs.encode()) <= _ATTACK_LOGS_CLAIM_CHECK_BYTES
+    ):
+        return threat_report.to_bytes()
+
+    threat_dict = threat_report.to_dict()
+    threat_dict["attack_logs"] = None
+    threat_dict["attack_logs_omitted"] = True
+    return orjson.dumps(threat_dict, default=str)
 
 
 class ThreatReportProducer:
-    """Produce and publish new threat report messages to a RabbitMQ exchange."""
+    """
+    Produce and publish new threat report messages to a RabbitMQ exchange.
+
+    The producer keeps one long-lived robust connection, channel, and declared
+    exchange, opened by `connect` (typically from the application lifespan) and
+    reused for every publish until `close` is called.
+
+    Requests hand messages off with `enqueue_new_threat_report`, which returns
+    immediately; a background task started by `start` drains the queue and
+    publishes, so the broker round-trip stays off the request path. Messages that
+    queue up meanwhile, or within a few milliseconds of the first one, are
+    published as one batch, awaiting their publisher confirms together rather than
+    one round-trip per message.
+
+    With `durable` off, the exchange is transient and messages are published
+    non-persistent, so the broker keeps them in memory instead of writing each one
+    to disk; the database stays the source of truth for the reports.
+    """
 
-    def __init__(self, rabbitmq_manager: AsyncRabbitmqManager) -> None:
+    def __init__(
+        self, rabbitmq_manager: AsyncRabbitmqManager, durable: bool = True
+    ) -> None:
         """Instantiate a `ThreatReportProducer` object."""
         self.rabbitmq_manager = rabbitmq_manager
+        self._durable = durable
+        self._delivery_mode = (
+            DeliveryMode.PERSISTENT if durable else DeliveryMode.NOT_PERSISTENT
+        )
+        self._connection: AbstractConnection | None = None
+        self._channel: AbstractChannel | None = None
+        self._exchange: AbstractExchange | None = None
+        self._lock = asyncio.Lock()
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(
+            maxsize=_PUBLISH_QUEUE_MAXSIZE
+        )
+        self._drain_task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the background task publishing the enqueued messages."""
+        if self._drain_task is None:
+            self._drain_task = asyncio.create_task(self._drain_queue())
+
+    async def connect(self) -> AbstractExchange:
+        """
+        Open the connection and channel, and declare the exchange, if not done yet.
+
+        Returns
+        -------
+        AbstractExchange
+            The declared threat report exchange.
+        """
+        if self._exchange is not None:
+            return self._exchange
+
+        async with self._lock:
+            if self._exchange is None:
+                logger.info(
+                    "Opening connection and channel to publish threat reports..."
+                )
+                try:
+                    self._connection = await self.rabbitmq_manager.get_connection()
+                    self._channel = await self.rabbitmq_manager.get_channel(
+                        connection=self._connection
+                    )
+                    self._exchange = await self.declare_threat_report_exchange(
+                        channel=self._channel
+                    )
+                except BaseException:
+                    # Drop the half-open connection, so the next publish reconnects.
+                    await self.close()
+                    raise
+        return self._exchange
 
-    async def produce_new_threat_report(self, threat_report: ThreatReport) -> None:
+    async def close(self) -> None:
+        """Close the connection, with its channel, so the next publish reconnects."""
+        connection = self._connection
+        self._connection = self._channel = self._exchange = None
+        if connection is not None:
+            await connection.close()
+
+    async def shutdown(self) -> None:
+        """
+        Stop the background task, then close the connection.
+
+        Enqueued messages are given a bounded amount of time to be published first.
+        """
+        if self._drain_task is not None:
+            try:
+                await asyncio.wait_for(
+                    self._queue.join(), timeout=_SHUTDOWN_FLUSH_TIMEOUT_SECONDS
+                )
+            except TimeoutError:
+                logger.warning(
+                    "Dropping %d unpublished threat reports on shutdown.",
+                    self._queue.qsize(),
+                )
+            self._drain_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._drain_task
+            self._drain_task = None
+
+        await self.close()
+
+    def enqueue_new_threat_report(self, threat_report: ThreatReport) -> None:
         """
-        Publish a threat message to a RabbitMQ exchange.
+        Serialize a threat report and queue it for publishing in the background.
 
         Parameters
         ----------
         threat_report : ThreatReport
             The threat report object to be serialized and published.
+
+        Raises
+        ------
+        asyncio.QueueFull
+            If the backlog of unpublished messages is full.
+        """
+        self._queue.put_nowait(_encode_threat_report_message(threat_report))
+
+    async def _drain_queue(self) -> None:
+        """Publish enqueued messages in batches until cancelled, logging failures."""
+        loop = asyncio.get_running_loop()
+        while True:
+            bodies = [await self._queue.get()]
+            deadline = loop.time() + _PUBLISH_BATCH_LINGER_SECONDS
+            while len(bodies) < _PUBLISH_BATCH_MAXSIZE:
+                if not self._queue.empty():
+                    bodies.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    bodies.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                    )
+                except TimeoutError:
+                    break
+            try:
+                await self.publish_batch(bodies=bodies)
+            except Exception:
+                logger.error(
+                    "Failed to send %d new threat reports to rabbitmq exchange.",
+                    len(bodies),
+                    exc_info=True,
+                )
+            finally:
+                for _ in bodies:
+                    self._queue.task_done()
+
+    async def publish_batch(self, bodies: list[bytes]) -> None:
         """
-        async with await self.rabbitmq_manager.get_connection() as connection:
-            logger.info("Opening connection and channel to publish thread report...")
-            channel = await self.rabbitmq_manager.get_channel(connection=connection)
-
-            threat_report_exchange = await self.declare_threat_report_exchange(
-                channel=channel
-            )
-
-            message = Message(
-                body=threat_report.to_bytes(),
-                delivery_mode=DeliveryMode.PERSISTENT,
-            )
-            publish_result = await threat_report_exchange.publish(
-                message=message, routing_key=self._get_new_threat_report_routing_key()
-            )
-            logger.info(
-                "Published threat report to the %s exchange with the result: %s",
-                THREAT_REPORT_EXCHANGE_NAME,
-                publish_result,
-            )
+        Publish serialized threat messages, awaiting their confirms together.
+
+        Every message is written to the channel before any confirm is awaited, so
+        the batch costs roughly one broker round-trip instead of one per message.
+
+        Parameters
+        ----------
+        bodies : list[bytes]
+            The serialized threat reports.
+
+        Raises
+        ------
+        Exception
+            The first publish failure, after every publish in the batch has settled.
+        """
+        threat_report_exchange = await self.connect()
+
+        results = await asyncio.gather(
+            *(
+                threat_report_exchange.publish(
+                    message=Message(body=body, delivery_mode=self._delivery_mode),
+                    routing_key=NEW_THREAT_REPORT_ROUTING_KEY,
+                )
+                for body in bodies
+            ),
+            return_exceptions=True,
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        logger.info(
+            "Published %d of %d threat reports to the %s exchange.",
+            len(results) - len(failures),
+            len(results),
+            THREAT_REPORT_EXCHANGE_NAME,
+        )
+        if failures:
+            raise failures[0]
 
     async def declare_threat_report_exchange(
         self, channel: AbstractChannel
@@ -67,17 +270,13 @@ class ThreatReportProducer:
             channel=channel,
             name=THREAT_REPORT_EXCHANGE_NAME,
             exchange_type=ExchangeType.DIRECT,
+            durable=self._durable,
         )
         return threat_report_exchange
 
-    @staticmethod
-    def _get_new_threat_report_routing_key() -> str:
-        """
-        Retrieve the routing key for new threat_report messages.
 
-        Returns
-        -------
-        str
-            The routing key for new threat reports, typically 'threat_reports.new'.
-        """
-        return "threat_report.new"
+# Shared producer, connected and closed by the application lifespan
+threat_report_producer = ThreatReportProducer(
+    rabbitmq_manager=rabbitmq_manager,
+    durable=settings.threat_report_durable_messages,
+)
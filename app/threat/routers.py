@@ -1,13 +1,16 @@
 """Module defines routers related to threat."""
 
-from typing import Annotated, Any
+from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.security import verify_token_dependency
 from app.threat.dependencies import get_threat_report_service
 from app.threat.schemas import ThreatReportInputSchema, ThreatReportOutputSchema
 from app.threat.services import ThreatReportService
+from toolkit.api.database import get_async_db_session
 from toolkit.api.enums import OpenAPITags
 
 router = APIRouter(
@@ -27,7 +30,8 @@ async def create_threat_report(
     threat_report_service: Annotated[
         ThreatReportService, Depends(get_threat_report_service)
     ],
-) -> dict[str, Any]:
+    db_session: Annotated[AsyncSession, Depends(get_async_db_session)],
+) -> ORJSONResponse:
     """
     Create a new threat report based on the provided details.
 
@@ -38,19 +42,23 @@ async def create_threat_report(
         A Pydantic schema containing the threat report details.
     threat_report_service : ThreatReportService
         A service dependency for handling threat report operations.
+    db_session : AsyncSession
+        The database session of the request.
 
     Returns
     -------
-    dict
-        A dictionary containing the status, message, and created threat report data.
+    ORJSONResponse
+        A response containing the status, message, and created threat report data.
 
     Notes
     -----
-    The system will process the threat report and notify relevant entities.
+    The system will process the threat report and notify relevant entities. The
+    response body is returned directly; `response_model` only documents it.
     """
-    return await threat_report_service.create_threat_and_notify_threat_report(
-        threat_report_input=threat_report_input
+    content = await threat_report_service.create_threat_and_notify_threat_report(
+        db_session=db_session, threat_report_input=threat_report_input
     )
+    return ORJSONResponse(content=content, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -63,7 +71,8 @@ async def get_threat_report(
     threat_report_service: Annotated[
         ThreatReportService, Depends(get_threat_report_service)
     ],
-) -> dict[str, Any]:
+    db_session: Annotated[AsyncSession, Depends(get_async_db_session)],
+) -> ORJSONResponse:
     """
     Retrieve a threat report by its unique identifier.
 
@@ -77,16 +86,20 @@ async def get_threat_report(
         The ID of the threat report to retrieve.
     threat_report_service : ThreatReportService
         A service dependency for handling threat report retrieval.
+    db_session : AsyncSession
+        The database session of the request.
 
     Returns
     -------
-    dict
-        A dictionary containing the status, message, and threat report details.
+    ORJSONResponse
+        A response containing the status, message, and threat report details.
 
     Notes
     -----
-    Ensure the provided threat report ID exists before calling this endpoint.
+    Ensure the provided threat report ID exists before calling this endpoint. The
+    response body is returned directly; `response_model` only documents it.
     """
-    return await threat_report_service.get_threat_report(
-        threat_report_id=threat_report_id
+    content = await threat_report_service.get_threat_report(
+        db_session=db_session, threat_report_id=threat_report_id
     )
+    return ORJSONResponse(content=content)
@@ -13,7 +13,11 @@ from toolkit.api.schemas.mixins import CommonMixins
 class ThreatReportInputSchema(BaseSchema):
     """Pydantic schema for threat report input validation."""
 
-    indicator_type: Annotated[ThreatType, Field(description="Threat indicator type")]
+    # Lax mode lets pydantic-core map the raw string onto a member with its own
+    # value lookup; strict mode would only accept `ThreatType` instances.
+    indicator_type: Annotated[
+        ThreatType, Field(strict=False, description="Threat indicator type")
+    ]
     indicator_address: Annotated[
         str, Field(max_length=255, description="Threat indicator address")
     ]
@@ -6,45 +6,91 @@ This module provides a service class for handling various threat-related operati
 
 from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.threat.dal import ThreatReportDataAccessLayer
 from app.threat.helpers.messages import ThreatReportMessage
+from app.threat.models import ThreatReport
 from app.threat.producer import ThreatReportProducer
-from app.threat.schemas import ThreatReportInputSchema
-from config.base import logger, rabbitmq_manager
+from app.threat.schemas import ThreatReportData, ThreatReportInputSchema
+from config.base import logger
 from toolkit.api.enums import HTTPStatusDoc, Status
 
+# The envelope of each response never varies, so its members are bound once; the
+# router returns the dict directly, without validating it against the schema.
+_CREATED_STATUS = Status.CREATED
+_CREATED_MESSAGE = ThreatReportMessage.SUCCESSFUL_CREATION.value
+_CREATED_DOC = HTTPStatusDoc.HTTP_STATUS_201
+_RETRIEVED_STATUS = Status.SUCCESS
+_RETRIEVED_MESSAGE = ThreatReportMessage.SUCCESSFUL_RETRIEVAL.value
+_RETRIEVED_DOC = HTTPStatusDoc.HTTP_STATUS_200
+
+# `(attribute, alias)` pairs of the response data schema, resolved once.
+_THREAT_REPORT_DATA_FIELDS = tuple(
+    (name, field.alias or name) for name, field in ThreatReportData.model_fields.items()
+)
+
+
+def _serialize_threat_report(threat_report: ThreatReport) -> dict[str, Any]:
+    """
+    Build the response data of a threat report, keyed by the schema's aliases.
+
+    Parameters
+    ----------
+    threat_report : ThreatReport
+        The loaded threat report.
+
+    Returns
+    -------
+    dict[str, Any]
+        The threat report data, shaped like `ThreatReportData` dumped by alias.
+    """
+    return {
+        alias: getattr(threat_report, name)
+        for name, alias in _THREAT_REPORT_DATA_FIELDS
+    }
 
-class ThreatReportService:
-    """Service class for threat-report-related operations."""
 
-    def __init__(self, db_session: async_scoped_session[AsyncSession]) -> None:
+class ThreatReportService:
+    """
+    Service class for threat-report-related operations.
+
+    The service holds no per-request state, so one instance can be shared; the
+    database session is passed to each method.
+    """
+
+    def __init__(
+        self,
+        threat_report_dal: ThreatReportDataAccessLayer,
+        threat_report_producer: ThreatReportProducer,
+    ) -> None:
         """
         Initialize the `ThreatReportService`.
 
         Parameters
         ----------
-        db_session : async_scoped_session[AsyncSession]
-            The database session for asynchronous operations.
+        threat_report_dal : ThreatReportDataAccessLayer
+            The data access layer for threat reports.
+        threat_report_producer : ThreatReportProducer
+            The producer publishing new threat reports to RabbitMQ.
         """
-        self.db_session = db_session
-        self.threat_report_dal = ThreatReportDataAccessLayer(db_session=db_session)
-        self.threat_report_producer = ThreatReportProducer(
-            rabbitmq_manager=rabbitmq_manager
-        )
+        self.threat_report_dal = threat_report_dal
+        self.threat_report_producer = threat_report_producer
 
     async def create_threat_and_notify_threat_report(
-        self, threat_report_input: ThreatReportInputSchema
+        self, db_session: AsyncSession, threat_report_input: ThreatReportInputSchema
     ) -> dict[str, Any]:
         """
         Create a new threat report and notify via RabbitMQ.
 
         This method handles the creation of a new threat report in the database and
-        sends a notification to RabbitMQ with the details of the new report.
+        queues a notification to RabbitMQ with the details of the new report, which
+        is published in the background.
 
         Parameters
         ----------
+        db_session : AsyncSession
+            The database session for asynchronous operations.
         threat_report_input : ThreatReportInputSchema
             The input data required for creating a new threat report.
 
@@ -52,32 +98,34 @@ class ThreatReportService:
         -------
         dict[str, Any]
             A dictionary containing the status, message, created threat report data,
-            and a documentation link.
+            and a documentation link, keyed by the aliases of the output schema.
         """
         created_threat_report = await self.threat_report_dal.create_threat_report(
-            threat_report_input=threat_report_input
+            db_session=db_session, threat_report_input=threat_report_input
         )
 
         try:
-            await self.threat_report_producer.produce_new_threat_report(
+            self.threat_report_producer.enqueue_new_threat_report(
                 threat_report=created_threat_report
             )
         except Exception:
             logger.error(
-                "Failed to send new threat report to rabbitmq exchange. "
+                "Failed to queue new threat report for the rabbitmq exchange. "
                 "Threat report: %s",
-                str(created_threat_report),
+                created_threat_report,
                 exc_info=True,
             )
 
         return {
-            "status": Status.CREATED,
-            "message": ThreatReportMessage.SUCCESSFUL_CREATION.value,
-            "data": created_threat_report,
-            "documentationLink": HTTPStatusDoc.HTTP_STATUS_201,
+            "status": _CREATED_STATUS,
+            "message": _CREATED_MESSAGE,
+            "data": _serialize_threat_report(created_threat_report),
+            "documentationLink": _CREATED_DOC,
         }
 
-    async def get_threat_report(self, threat_report_id: int) -> dict[str, Any]:
+    async def get_threat_report(
+        self, db_session: AsyncSession, threat_report_id: int
+    ) -> dict[str, Any]:
         """
         Retrieve a threat report by its ID.
 
@@ -86,6 +134,8 @@ class ThreatReportService:
 
         Parameters
         ----------
+        db_session : AsyncSession
+            The database session for asynchronous operations.
         threat_report_id : int
             The ID of the threat report to retrieve.
 
@@ -93,14 +143,14 @@ class ThreatReportService:
         -------
         dict[str, Any]
             A dictionary containing the status, message, retrieved threat report data,
-            and a documentation link.
+            and a documentation link, keyed by the aliases of the output schema.
         """
         retrieved_threat_report = await self.threat_report_dal.get_threat_report(
-            threat_report_id=threat_report_id
+            db_session=db_session, threat_report_id=threat_report_id
         )
         return {
-            "status": Status.SUCCESS,
-            "message": ThreatReportMessage.SUCCESSFUL_RETRIEVAL,
-            "data": retrieved_threat_report,
-            "documentationLink": HTTPStatusDoc.HTTP_STATUS_200,
+            "status": _RETRIEVED_STATUS,
+            "message": _RETRIEVED_MESSAGE,
+            "data": _serialize_threat_report(retrieved_threat_report),
+            "documentationLink": _RETRIEVED_DOC,
         }
@@ -0,0 +1,38 @@
+"""Replace user email index with a partial index on active users
+
+Revision ID: 0571d5f8d77d
+Revises: 4e54ac34647b
+Create Date: 2026-10-14 10:12:31.482915
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0571d5f8d77d"
+down_revision: Union[str, None] = "4e54ac34647b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_user_email", table_name="auth__user")
+    op.create_index(
+        "ix_user_email_active",
+        "auth__user",
+        ["email"],
+        unique=False,
+        postgresql_where=sa.text("is_active IS true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_user_email_active",
+        table_name="auth__user",
+        postgresql_where=sa.text("is_active IS true"),
+    )
+    op.create_index("ix_user_email", "auth__user", ["email"], unique=False)
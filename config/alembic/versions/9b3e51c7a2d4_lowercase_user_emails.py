@@ -0,0 +1,28 @@
+"""Lowercase stored user emails
+
+Revision ID: 9b3e51c7a2d4
+Revises: 0571d5f8d77d
+Create Date: 2026-10-14 11:02:47.215306
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3e51c7a2d4"
+down_revision: Union[str, None] = "0571d5f8d77d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fails on the `auth__user_email_key` unique constraint if two users' emails
+    # differ only by case; such accounts must be merged by hand first.
+    op.execute("UPDATE auth__user SET email = lower(email) WHERE email <> lower(email)")
+
+
+def downgrade() -> None:
+    # The original casing is not recoverable; lowercased emails remain valid.
+    pass
@@ -0,0 +1,37 @@
+"""Drop unused timestamp indexes on threat reports
+
+Revision ID: c41d2f7e8a06
+Revises: 9b3e51c7a2d4
+Create Date: 2026-10-14 19:48:05.630174
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d2f7e8a06"
+down_revision: Union[str, None] = "9b3e51c7a2d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_threat_report_modified_at", table_name="threat__threat_report")
+    op.drop_index("idx_threat_report_created_at", table_name="threat__threat_report")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_threat_report_created_at",
+        "threat__threat_report",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_threat_report_modified_at",
+        "threat__threat_report",
+        ["modified_at"],
+        unique=False,
+    )
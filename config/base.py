@@ -1,31 +1,105 @@
-"""Module for defining base configurations."""
+"""
+Module for defining base configurations.
 
-from config.rabbitmq import AsyncRabbitmqManager
-from config.redis import AsyncRedisConnection
+Only the settings are created on import. The logger and the database, RabbitMQ, and
+Redis managers are created, along with importing their client libraries, on first
+access, so importing this module just for the settings, as the Alembic environment
+does, stays cheap.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-from .database import AsyncDatabaseConnection
-from .logging import LoggingConfig
 from .settings.base import Settings
 
+if TYPE_CHECKING:
+    import logging
+
+    from config.rabbitmq import AsyncRabbitmqManager
+    from config.redis import AsyncRedisConnection
+
+    from .database import AsyncDatabaseConnection
+
+    logger: logging.Logger
+    db: AsyncDatabaseConnection
+    rabbitmq_manager: AsyncRabbitmqManager
+    redis_manager: AsyncRedisConnection
+
+
 # Settings
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """Get the application settings, loading them on the first call."""
+    return Settings()
+
+
+settings = get_settings()
+
 
 # Logging
-logger = LoggingConfig(env=settings.env).get_logger()
+@cache
+def get_logger() -> logging.Logger:
+    """Get the application logger, configuring logging on the first call."""
+    from .logging import LoggingConfig
+
+    return LoggingConfig(env=settings.env).get_logger()
+
 
 # Database
-db = AsyncDatabaseConnection(database_url=settings.database_url)
+@cache
+def get_db() -> AsyncDatabaseConnection:
+    """Get the shared database connection manager."""
+    from .database import AsyncDatabaseConnection
+
+    return AsyncDatabaseConnection(
+        database_url=settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+
 
 # RabbitMQ
-rabbitmq_manager = AsyncRabbitmqManager(amqp_url=settings.amqp_url)
+@cache
+def get_rabbitmq_manager() -> AsyncRabbitmqManager:
+    """Get the shared RabbitMQ manager."""
+    from config.rabbitmq import AsyncRabbitmqManager
+
+    return AsyncRabbitmqManager(amqp_url=settings.amqp_url)
+
 
 # Redis
-redis_manager = AsyncRedisConnection(
-    host=settings.redis_host,
-    port=settings.redis_port,
-    db=settings.redis_db,
-    password=settings.redis_password,
-    max_connection=settings.redis_pool_max_connection,
-)
-
-__all__ = ["AsyncRabbitmqManager"]
+@cache
+def get_redis_manager() -> AsyncRedisConnection:
+    """Get the shared Redis connection manager."""
+    from config.redis import AsyncRedisConnection
+
+    return AsyncRedisConnection(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        password=settings.redis_password,
+        max_connection=settings.redis_pool_max_connection,
+        pool_timeout=settings.redis_pool_timeout,
+        single_connection=settings.redis_single_connection,
+    )
+
+
+_LAZY_ATTRIBUTES = {
+    "logger": get_logger,
+    "db": get_db,
+    "rabbitmq_manager": get_rabbitmq_manager,
+    "redis_manager": get_redis_manager,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Create the lazily initialized module attributes on first access."""
+    try:
+        accessor = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = accessor()
+    globals()[name] = value
+    return value
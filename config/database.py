@@ -2,25 +2,42 @@
 
 from __future__ import annotations
 
-from asyncio import current_task
+from asyncio import gather
+from contextlib import AsyncExitStack
 
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
-    async_scoped_session,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# The statement used to check connections, built once.
+_PING = text("SELECT 1")
 
 
 class AsyncDatabaseConnection:
     """Class for managing async database connections."""
 
-    def __init__(self, database_url: str) -> None:
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 32,
+        max_overflow: int = 16,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 1800,
+        query_cache_size: int = 1200,
+    ) -> None:
         """Initialize AsyncDatabaseConnection."""
         self._database_url = database_url
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._pool_pre_ping = pool_pre_ping
+        self._pool_recycle = pool_recycle
+        self._query_cache_size = query_cache_size
         self._engine: AsyncEngine | None = None
         self._session_factory: async_sessionmaker[AsyncSession] | None = None
 
@@ -34,7 +51,15 @@ class AsyncDatabaseConnection:
             The async database engine object.
         """
         if not self._engine:
-            self._engine = create_async_engine(self._database_url)
+            self._engine = create_async_engine(
+                self._database_url,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=self._pool_size,
+                max_overflow=self._max_overflow,
+                pool_pre_ping=self._pool_pre_ping,
+                pool_recycle=self._pool_recycle,
+                query_cache_size=self._query_cache_size,
+            )
         return self._engine
 
     def get_session_factory(self) -> async_sessionmaker[AsyncSession]:
@@ -53,18 +78,6 @@ class AsyncDatabaseConnection:
             )
         return self._session_factory
 
-    def get_session(self) -> async_scoped_session[AsyncSession]:
-        """
-        Get a scoped async database session.
-
-        Returns
-        -------
-        sqlalchemy.ext.asyncio.async_scoped_session
-            A scoped async session object.
-        """
-        session = self.get_session_factory()
-        return async_scoped_session(session, scopefunc=current_task)
-
     async def close_engine(self) -> None:
         """Close the async database engine."""
         if self._engine:
@@ -82,7 +95,45 @@ class AsyncDatabaseConnection:
         try:
             engine = self.get_engine()
             async with engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
+                await conn.execute(_PING)
             return True
+        except (SQLAlchemyError, OSError):
+            return False
+
+    async def warm_up(self, connections: int | None = None) -> bool:
+        """
+        Pre-create pooled connections so early requests don't pay the connect cost.
+
+        Parameters
+        ----------
+        connections : int | None, optional
+            The number of connections to open, by default the configured pool size.
+
+        Returns
+        -------
+        bool
+            True if every connection was opened successfully, False otherwise.
+        """
+        connections = self._pool_size if connections is None else connections
+        try:
+            engine = self.get_engine()
         except SQLAlchemyError:
             return False
+
+        async def open_connection(stack: AsyncExitStack) -> None:
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(_PING)
+
+        # Hold every connection open at once, forcing the pool to create them, and
+        # connect concurrently so startup waits for about one connect, not N.
+        async with AsyncExitStack() as stack:
+            results = await gather(
+                *(open_connection(stack) for _ in range(connections)),
+                return_exceptions=True,
+            )
+        for result in results:
+            if isinstance(result, (SQLAlchemyError, OSError)):
+                return False
+            if isinstance(result, BaseException):
+                raise result
+        return True
@@ -1,9 +1,11 @@
 """Module for configuring logging settings."""
 
+import copy
 import logging
 import logging.config
 import logging.handlers
 import os
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,10 +13,41 @@ import coloredlogs
 
 from toolkit.parsers import TOMLParser
 
+from .settings.enums import Env
+
+_SITE_PACKAGES = "site-packages" + os.sep
+
+
+@lru_cache(maxsize=4096)
+def _relative_path(pathname: str, cwd: str) -> str:
+    """
+    Return the path of a module relative to `cwd`, or to site-packages.
+
+    Records come from a bounded set of modules, so the result is cached per path.
+    """
+    relativepath = os.path.relpath(pathname, start=cwd)
+
+    # If the record is for a third-party logger, remove the path to site-packages/.
+    _, separator, package_path = relativepath.rpartition(_SITE_PACKAGES)
+    if separator:
+        relativepath = package_path
+    return relativepath
+
+
+@cache
+def _read_logging_config(config_path: str) -> dict[str, Any]:
+    """Parse the logging section of a config file once per path."""
+    logging_config: dict[str, Any] = TOMLParser(file_path=config_path).read()["logging"]
+    return logging_config
+
 
 class RelativePathFilter:
     """A logging filter that adds a `relativepath` attribute to log records."""
 
+    def __init__(self) -> None:
+        """Instantiate a `RelativePathFilter`, resolving the working directory."""
+        self._cwd = os.getcwd()
+
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Modify the log record to include a `relativepath` attribute.
@@ -33,16 +66,9 @@ class RelativePathFilter:
         -----
         The `relativepath` is computed by checking for site-packages`paths.
         It strips these paths to show only the relevant file path for debugging.
+        The working directory is resolved once, when the filter is created.
         """
-        relativepath = os.path.relpath(record.pathname, start=os.getcwd())
-
-        # If the record is for a third-party logger, remove the path to site-packages/.
-        if "site-packages" in relativepath:
-            try:
-                relativepath = relativepath.split("site-packages/")[1]
-            except IndexError:
-                pass  # Ignore if it doesn't match the expected structure.
-        setattr(record, "relativepath", relativepath)
+        setattr(record, "relativepath", _relative_path(record.pathname, self._cwd))
 
         return True
 
@@ -54,7 +80,7 @@ class LoggingConfig:
         self, env: str = "development", config_path: str = "settings.toml"
     ) -> None:
         self._env = env
-        self._parser = TOMLParser(file_path=config_path)
+        self._config_path = config_path
         self._logger: logging.Logger | None = None
 
     def get_logger(self) -> logging.Logger:
@@ -66,10 +92,12 @@ class LoggingConfig:
 
     def setup(self) -> None:
         """Set up the logging configurations."""
-        logging_config = self._parser.read()["logging"]
+        # `dictConfig` pops keys off the config it's given, so each setup gets a copy
+        # of the cached one.
+        logging_config = copy.deepcopy(_read_logging_config(self._config_path))
 
         # Check or create the dirs of log files specified in the config.
-        handlers = logging_config.get("handlers", None)
+        handlers: dict[str, dict[str, Any]] = logging_config.get("handlers", {})
         self.validate_and_create_dirs(handlers=handlers)
 
         # Config logging based on the configuration data.
@@ -82,10 +110,12 @@ class LoggingConfig:
         for handler in self._logger.handlers:
             handler.addFilter(RelativePathFilter())
 
-        # Set up coloredlogs
+        # Set up coloredlogs. Outside development the output goes to log collectors,
+        # not terminals, so it's formatted plainly, without ANSI color codes.
         coloredlogs.install(
             level="DEBUG",
             logger=self._logger,
+            isatty=None if self._env == Env.DEVELOPMENT else False,
             fmt=logging_config["formatters"]["coreFormatter"]["format"],
             datefmt=logging_config["formatters"]["coreFormatter"]["datefmt"],
         )
@@ -68,6 +68,8 @@ class AsyncRabbitmqManager:
     ```
     """
 
+    __slots__ = ("_amqp_url",)
+
     def __init__(self, amqp_url: str) -> None:
         """Initialize an `AsyncRabbitmqManager` object."""
         self._amqp_url = amqp_url
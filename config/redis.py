@@ -1,15 +1,27 @@
 """Module for defining redis configurations."""
 
+import asyncio
+
 import redis
 import redis.exceptions
-from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis
+from redis.asyncio.connection import AbstractConnection
+
+from config.base import logger
 
 
 class AsyncRedisConnection:
     """class encapsulate Redis connection logic, providing an asynchronous interface."""
 
     def __init__(
-        self, host: str, port: int, db: int, password: str, max_connection: int
+        self,
+        host: str,
+        port: int,
+        db: int,
+        password: str,
+        max_connection: int,
+        pool_timeout: int = 2,
+        single_connection: bool = False,
     ):
         """Instantiate an `AsyncRedisConnection` object."""
         self.host = host
@@ -17,6 +29,8 @@ class AsyncRedisConnection:
         self.db = db
         self.password = password
         self.max_connection = max_connection
+        self.pool_timeout = pool_timeout
+        self.single_connection = single_connection
 
         self.redis_client: Redis | None = None
         self.connection_pool: ConnectionPool | None = None
@@ -25,12 +39,25 @@ class AsyncRedisConnection:
         """
         Lazily initializes and returns the Redis client.
 
+        In single connection mode, the client sends every command over one connection,
+        serialized by a lock, and no connection pool is created.
+
         Returns
         -------
         redis.asyncio.Redis
             The Redis client.
         """
-        if not self.redis_client:
+        if not self.redis_client and self.single_connection:
+            self.redis_client = Redis(
+                host=self.host,
+                port=self.port,
+                db=self.db,
+                password=self.password,
+                encoding="utf-8",
+                decode_responses=True,
+                single_connection_client=True,
+            )
+        elif not self.redis_client:
             connection_pool = self.get_connection_pool()
             self.redis_client = Redis(
                 host=self.host,
@@ -45,27 +72,29 @@ class AsyncRedisConnection:
         """
         Lazily initializes and returns the Redis connection pool.
 
+        When every connection is in use, callers wait up to `pool_timeout` seconds for
+        one to be released, instead of the pool opening connections past its limit.
+
         Returns
         -------
         redis.asyncio.ConnectionPool
             The Redis connection pool.
         """
         if not self.connection_pool:
-            self.connection_pool = ConnectionPool(
+            self.connection_pool = BlockingConnectionPool(
                 host=self.host,
                 port=self.port,
                 db=self.db,
                 max_connections=self.max_connection,
+                timeout=self.pool_timeout,
                 encoding="utf-8",
                 decode_responses=True,
             )
         return self.connection_pool
 
     def get_connection(self) -> Redis:
-        """Return a `Redis` client from the connection pool."""
-        redis_client = self.get_client()
-        connection_pool = self.get_connection_pool()
-        return redis_client.from_pool(connection_pool)
+        """Return the `Redis` client, which already draws from the connection pool."""
+        return self.get_client()
 
     async def disconnect(self) -> None:
         """Close the Redis client connection asynchronously."""
@@ -87,8 +116,45 @@ class AsyncRedisConnection:
             is_available: bool = await redis_client.ping()
             return is_available
         except redis.exceptions.ConnectionError:
-            from config.base import logger
-
             logger.error("Redis instance is not available.", exc_info=True)
 
             return False
+
+    async def warm_up(self, connections: int = 4) -> bool:
+        """
+        Pre-create pooled connections so early requests don't pay the connect cost.
+
+        Parameters
+        ----------
+        connections : int, optional
+            The number of connections to open, by default 4. In single connection
+            mode, its one connection is opened instead.
+
+        Returns
+        -------
+        bool
+            True if every connection was opened successfully, False otherwise.
+        """
+        if self.single_connection:
+            return await self.test_connection()
+
+        connection_pool = self.get_connection_pool()
+        # Hold every connection at once, forcing the pool to open them, then hand
+        # them back as idle connections. redis-py leaves the pool's `get_connection`
+        # unannotated.
+        results: list[AbstractConnection | BaseException] = await asyncio.gather(
+            *(
+                connection_pool.get_connection("PING")  # type: ignore[no-untyped-call]
+                for _ in range(min(connections, self.max_connection))
+            ),
+            return_exceptions=True,
+        )
+        is_warmed_up = True
+        for result in results:
+            if isinstance(result, (redis.exceptions.RedisError, OSError)):
+                is_warmed_up = False
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                await connection_pool.release(result)
+        return is_warmed_up
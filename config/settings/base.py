@@ -1,5 +1,6 @@
 """Module for handling all the settings in the application."""
 
+import hashlib
 import os
 from pathlib import Path
 from typing import Annotated, Any
@@ -18,6 +19,12 @@ from pydantic_settings import (
 from .enums import Env
 from .openapi import OpenAPISettings
 
+# Loaded keys, keyed by the key file's path and modification time (and a digest of
+# the passphrase), so building the settings again doesn't re-run the passphrase key
+# derivation.
+_private_keys: dict[tuple[Path, int, bytes], RSAPrivateKey] = {}
+_public_keys: dict[tuple[Path, int], RSAPublicKey] = {}
+
 
 class Settings(BaseSettings):
     """
@@ -41,9 +48,25 @@ class Settings(BaseSettings):
 
     # PostgreSQL settings
     database_url: Annotated[str, Field(..., description="Database connection URL.")]
+    db_pool_size: Annotated[
+        int, Field(..., ge=1, description="Database pool persistent connections.")
+    ] = 32
+    db_max_overflow: Annotated[
+        int, Field(..., ge=0, description="Database pool connections beyond the size.")
+    ] = 16
 
     # RabbitMQ settings
     amqp_url: Annotated[str, Field(..., description="AMQP-RabbitMQ connection URL.")]
+    threat_report_durable_messages: Annotated[
+        bool,
+        Field(
+            ...,
+            description=(
+                "Whether threat report messages survive broker restarts, on a durable "
+                "exchange with persistent delivery."
+            ),
+        ),
+    ] = True
 
     # Redis settings
     redis_host: Annotated[
@@ -58,7 +81,22 @@ class Settings(BaseSettings):
     redis_password: Annotated[str, Field(..., description="Redis instance password.")]
     redis_pool_max_connection: Annotated[
         int, Field(..., description="Redis pool max connection limit.")
-    ] = 100
+    ] = 32
+    redis_pool_timeout: Annotated[
+        int,
+        Field(
+            ...,
+            gt=0,
+            description="Seconds to wait for a free Redis pool connection.",
+        ),
+    ] = 2
+    redis_single_connection: Annotated[
+        bool,
+        Field(
+            ...,
+            description="Send every Redis command over one connection, without a pool.",
+        ),
+    ] = False
 
     # API settings
     jwt_algorithm: Annotated[
@@ -90,10 +128,29 @@ class Settings(BaseSettings):
     jwt_refresh_token_lifetime_days: Annotated[
         int, Field(..., description="The jwt refresh token lifetime in days.")
     ]
+    bcrypt_rounds: Annotated[
+        int,
+        Field(
+            ...,
+            ge=4,
+            le=31,
+            description="The bcrypt work factor (log2 rounds) for hashing passwords.",
+        ),
+    ] = 12
     origins: Annotated[
         list[str], Field(..., description="List of allowed API origins.")
     ]
 
+    # Health check settings
+    health_check_interval_seconds: Annotated[
+        float,
+        Field(
+            ...,
+            gt=0,
+            description="Interval between background health probes, in seconds.",
+        ),
+    ] = 5.0
+
     @field_validator("jwt_private_key", mode="before")
     @classmethod
     def load_private_key(cls, value: Any, info: ValidationInfo) -> RSAPrivateKey:
@@ -133,7 +190,10 @@ class Settings(BaseSettings):
             )
 
         path = Path(private_key_path)
-        if not path.exists():
+        # One `stat` both checks that the key exists and dates it for the cache.
+        try:
+            modified_at = path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise RuntimeError(
                 "The private and public keys are not generated yet. Try to generate "
                 f"keys in the {private_key_path} path, using the command "
@@ -143,14 +203,19 @@ class Settings(BaseSettings):
                 "You can read `docs/security/create_jwt_keys` for clear instructions."
             )
 
-        with path.open("rb") as key_file:
-            private_key = serialization.load_ssh_private_key(
-                key_file.read(), password=keys_passphrase.encode("utf-8")
-            )
+        passphrase = keys_passphrase.encode("utf-8")
+        cache_key = (path, modified_at, hashlib.sha256(passphrase).digest())
+        if cache_key in _private_keys:
+            return _private_keys[cache_key]
+
+        private_key = serialization.load_ssh_private_key(
+            path.read_bytes(), password=passphrase
+        )
         assert isinstance(private_key, RSAPrivateKey), (
             "jwt_private_key should be instance of `RSAPrivateKey`, but got "
             f"{type(private_key)}"
         )
+        _private_keys[cache_key] = private_key
         return private_key
 
     @field_validator("jwt_public_key", mode="before")
@@ -190,7 +255,10 @@ class Settings(BaseSettings):
             )
 
         path = Path(public_key_path)
-        if not path.exists():
+        # One `stat` both checks that the key exists and dates it for the cache.
+        try:
+            modified_at = path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise RuntimeError(
                 "The private and public keys are not generated yet. Try to generate "
                 f"keys in the {public_key_path} path, using the command "
@@ -200,12 +268,16 @@ class Settings(BaseSettings):
                 "You can read `docs/security/create_jwt_keys` for clear instructions."
             )
 
-        with path.open("rb") as key_file:
-            public_key = serialization.load_ssh_public_identity(key_file.read())
+        cache_key = (path, modified_at)
+        if cache_key in _public_keys:
+            return _public_keys[cache_key]
+
+        public_key = serialization.load_ssh_public_identity(path.read_bytes())
         assert isinstance(public_key, RSAPublicKey), (
             "jwt_private_key should be instance of `RSAPublicKey`, but got "
             f"{type(public_key)}"
         )
+        _public_keys[cache_key] = public_key
         return public_key
 
     # Settings config
@@ -213,7 +285,6 @@ class Settings(BaseSettings):
         toml_file="settings.toml",
         env_file=f".env.{os.getenv('ENV', 'development')}",
         case_sensitive=False,
-        use_enum_values=True,
         extra="ignore",
     )
 
@@ -1,9 +1,10 @@
 """Module defining Pydantic models for OpenAPI settings."""
 
+from functools import cached_property
 from typing import Any
 
-from pydantic import AnyHttpUrl, BaseModel, EmailStr
-from pydantic_settings import BaseSettings
+from pydantic import AnyHttpUrl, BaseModel, ConfigDict, EmailStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from toolkit.api.schemas.errors import (
     BadRequest,
@@ -22,6 +23,8 @@ class ContactSettings(BaseModel):
     name: str
     email: EmailStr
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class LicenseSettings(BaseModel):
     """License information for the API."""
@@ -29,6 +32,8 @@ class LicenseSettings(BaseModel):
     name: str
     url: AnyHttpUrl
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class TagSettings(BaseModel):
     """Tag information for the API."""
@@ -36,6 +41,8 @@ class TagSettings(BaseModel):
     name: str
     description: str
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class OpenAPISettings(BaseSettings):
     """Settings for OpenAPI configuration."""
@@ -47,6 +54,23 @@ class OpenAPISettings(BaseSettings):
     license: LicenseSettings
     tags: list[TagSettings]
 
+    model_config = SettingsConfigDict(frozen=True, extra="forbid")
+
+    @cached_property
+    def contact_dict(self) -> dict[str, Any]:
+        """Return the contact information as a dictionary, dumped once."""
+        return self.contact.model_dump()
+
+    @cached_property
+    def license_dict(self) -> dict[str, Any]:
+        """Return the license information as a dictionary, dumped once."""
+        return self.license.model_dump()
+
+    @cached_property
+    def tags_dict(self) -> list[dict[str, Any]]:
+        """Return the tags as a list of dictionaries, dumped once."""
+        return [tag.model_dump() for tag in self.tags]
+
 
 # response variable holding additional responses for app instance
 responses: dict[str | int, dict[str, Any]] = {
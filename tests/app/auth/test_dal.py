@@ -0,0 +1,131 @@
+"""Tests for the AuthDataAccessLayer class in app.auth.dal module."""
+
+from typing import Any
+
+import asyncpg
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import AsyncAdapt_asyncpg_dbapi
+from sqlalchemy.exc import IntegrityError
+
+from app.auth.dal import AuthDataAccessLayer, UserSnapshot
+from app.auth.helpers.exceptions import DuplicateUserError, UserDoesNotExistError
+
+
+class FakeResult:
+    """Stand-in for a SQLAlchemy result holding at most one row."""
+
+    def __init__(self, row: tuple[Any, ...] | None) -> None:
+        self.row = row
+
+    def one_or_none(self) -> tuple[Any, ...] | None:
+        """Return the row, if any."""
+        return self.row
+
+
+class FakeSession:
+    """Stand-in for an `AsyncSession`, returning the queued rows one per execute."""
+
+    def __init__(self, *rows: tuple[Any, ...] | None) -> None:
+        self.rows = list(rows)
+        self.executed = 0
+
+    async def execute(self, statement: Any, params: dict[str, Any]) -> FakeResult:
+        """Return the next queued row, counting the round-trips."""
+        self.executed += 1
+        return FakeResult(self.rows.pop(0))
+
+
+def make_integrity_error(sqlstate: str, constraint_name: str | None) -> IntegrityError:
+    """
+    Build an `IntegrityError` the way SQLAlchemy's asyncpg adapter raises it.
+
+    The adapter's error carries the SQLSTATE, and wraps the original asyncpg error,
+    which carries the constraint name, as its cause.
+    """
+    fields = {"C": sqlstate, "M": "duplicate key value violates unique constraint"}
+    if constraint_name is not None:
+        fields["n"] = constraint_name
+    asyncpg_error = asyncpg.exceptions.UniqueViolationError.new(fields)
+
+    adapted_error = AsyncAdapt_asyncpg_dbapi.IntegrityError(str(asyncpg_error))
+    adapted_error.sqlstate = sqlstate
+    adapted_error.__cause__ = asyncpg_error
+    return IntegrityError("INSERT INTO auth__user ...", {}, adapted_error)
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize(
+    ["constraint_name", "message"],
+    [
+        ("auth__user_username_key", "User with this username already exists"),
+        ("auth__user_email_key", "User with this email already exists"),
+    ],
+)
+def test_handle_integrity_error_duplicate_user(
+    constraint_name: str, message: str
+) -> None:
+    """Test unique violations of the user constraints raise `DuplicateUserError`."""
+    exc = make_integrity_error("23505", constraint_name)
+
+    with pytest.raises(DuplicateUserError, match=message) as exc_info:
+        AuthDataAccessLayer.handle_integrity_error(exc=exc)
+
+    assert exc_info.value.__cause__ is exc
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize(
+    ["sqlstate", "constraint_name"],
+    [
+        ("23505", "auth__user_other_key"),
+        ("23505", None),
+        ("23503", "auth__user_email_key"),
+    ],
+)
+def test_handle_integrity_error_other_errors(
+    sqlstate: str, constraint_name: str | None
+) -> None:
+    """Test other integrity errors are re-raised as they are."""
+    exc = make_integrity_error(sqlstate, constraint_name)
+
+    with pytest.raises(IntegrityError) as exc_info:
+        AuthDataAccessLayer.handle_integrity_error(exc=exc)
+
+    assert exc_info.value is exc
+
+
+@pytest.mark.exception
+def test_handle_integrity_error_without_driver_error() -> None:
+    """Test an integrity error without the driver's error is re-raised as it is."""
+    exc = IntegrityError("INSERT INTO auth__user ...", {}, None)
+
+    with pytest.raises(IntegrityError) as exc_info:
+        AuthDataAccessLayer.handle_integrity_error(exc=exc)
+
+    assert exc_info.value is exc
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_email() -> None:
+    """Test the active user with the given email is returned as a snapshot."""
+    session = FakeSession((1, "john", "john@example.com", "hashed", True))
+    db_session: Any = session
+
+    user = await AuthDataAccessLayer(db_session).get_user_by_email("john@example.com")
+
+    assert user == UserSnapshot(1, "john", "john@example.com", "hashed", True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.exception
+async def test_get_user_by_email_is_not_cached() -> None:
+    """Test every lookup reads the database, so a deactivated user is rejected."""
+    session = FakeSession((1, "john", "john@example.com", "hashed", True), None)
+    db_session: Any = session
+    user_dal = AuthDataAccessLayer(db_session)
+
+    await user_dal.get_user_by_email("john@example.com")
+    with pytest.raises(UserDoesNotExistError):
+        await user_dal.get_user_by_email("john@example.com")
+
+    assert session.executed == 2
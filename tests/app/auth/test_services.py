@@ -0,0 +1,73 @@
+"""Tests for the TokenService class in app.auth.services module."""
+
+import jwt
+import pytest
+
+from app.auth.dal import UserSnapshot
+from app.auth.services import TokenService
+from config.base import settings
+from toolkit.api.exceptions import UnauthorizedError
+
+
+@pytest.fixture
+def token_service() -> TokenService:
+    """Fixture to instantiate TokenService."""
+    return TokenService()
+
+
+@pytest.fixture
+def user() -> UserSnapshot:
+    """Fixture to create a user snapshot."""
+    return UserSnapshot(42, "john", "john@example.com", "hashed", True)
+
+
+@pytest.mark.smoke
+def test_encode_matches_pyjwt(token_service: TokenService, user: UserSnapshot) -> None:
+    """Test the prepared signer produces the exact token `jwt.encode` produces."""
+    payload = token_service._generate_payload(user=user)
+
+    token = token_service._encode(payload=payload)
+
+    assert token == jwt.encode(
+        payload, settings.jwt_private_key, algorithm=settings.jwt_algorithm
+    )
+
+
+def test_granted_token_decodes_with_pyjwt(
+    token_service: TokenService, user: UserSnapshot
+) -> None:
+    """Test a granted token decodes with `jwt.decode`, for the `all` audience."""
+    token = token_service.grant_token(user=user)["accessToken"]
+
+    claims = jwt.decode(
+        token,
+        settings.jwt_public_key,
+        algorithms=[settings.jwt_algorithm],
+        audience="all",
+    )
+
+    assert claims["sub"] == "42"
+    assert claims["aud"] == ["all"]
+    assert claims["exp"] - claims["iat"] == settings.jwt_lifetime_minutes * 60
+    assert jwt.get_unverified_header(token) == {
+        "alg": settings.jwt_algorithm,
+        "typ": "JWT",
+    }
+
+
+def test_verify_token(token_service: TokenService, user: UserSnapshot) -> None:
+    """Test a granted token passes verification."""
+    token = token_service.grant_token(user=user)["accessToken"]
+
+    token_service.verify_token(token)
+
+
+@pytest.mark.exception
+def test_verify_tampered_token(token_service: TokenService, user: UserSnapshot) -> None:
+    """Test a token whose claims were altered fails verification."""
+    token = token_service.grant_token(user=user)["accessToken"]
+    header, _, signature = token.split(".")
+    forged_payload = jwt.utils.base64url_encode(b'{"sub":"1","aud":["all"]}').decode()
+
+    with pytest.raises(UnauthorizedError):
+        token_service.verify_token(f"{header}.{forged_payload}.{signature}")
@@ -0,0 +1,174 @@
+"""Tests for the exception handlers in app.exception_handlers module."""
+
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+
+from app.exception_handlers import (
+    _INTERNAL_ERROR_BODY,
+    custom_http_exception_handler,
+    does_not_exist_exception_handler,
+    duplicate_resource_error_handler,
+    internal_exception_handler,
+    request_validation_exception_handler,
+    unauthorized_exception_handler,
+)
+from toolkit.api.enums import HTTPStatusDoc, Status
+from toolkit.api.exceptions import (
+    CustomHTTPException,
+    DoesNotExistError,
+    DuplicateResourceError,
+    UnauthorizedError,
+)
+
+DOCS_URL = "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status"
+
+
+def create_app() -> FastAPI:
+    """Create an app registering the handlers, with routes raising each error."""
+    app = FastAPI()
+    app.add_exception_handler(Exception, internal_exception_handler)
+    app.add_exception_handler(CustomHTTPException, custom_http_exception_handler)
+    app.add_exception_handler(
+        RequestValidationError, request_validation_exception_handler
+    )
+    app.add_exception_handler(DoesNotExistError, does_not_exist_exception_handler)
+    app.add_exception_handler(DuplicateResourceError, duplicate_resource_error_handler)
+    app.add_exception_handler(UnauthorizedError, unauthorized_exception_handler)
+
+    @app.get("/unauthorized")
+    async def unauthorized() -> None:
+        raise UnauthorizedError("Invalid credentials.")
+
+    @app.get("/does-not-exist")
+    async def does_not_exist() -> None:
+        raise DoesNotExistError("Threat report not found")
+
+    @app.get("/duplicate")
+    async def duplicate() -> None:
+        raise DuplicateResourceError("User with this email already exists")
+
+    @app.get("/custom")
+    async def custom(with_details: bool = False) -> None:
+        raise CustomHTTPException(
+            status_code=503,
+            status=Status.ERROR,
+            message="Service unavailable.",
+            field="database" if with_details else None,
+            reason="Connection refused." if with_details else None,
+            documentation_link=HTTPStatusDoc.HTTP_STATUS_503,
+        )
+
+    @app.get("/validated")
+    async def validated(page: int) -> None:
+        return None
+
+    @app.get("/internal")
+    async def internal() -> None:
+        raise RuntimeError("Unexpected failure")
+
+    return app
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """Fixture to create a client of the app, returning server errors' responses."""
+    return TestClient(create_app(), raise_server_exceptions=False)
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize(
+    ["path", "status_code", "body"],
+    [
+        (
+            "/unauthorized",
+            401,
+            {
+                "status": "unauthorized",
+                "message": "Invalid credentials.",
+                "details": None,
+                "documentationLink": f"{DOCS_URL}/401",
+            },
+        ),
+        (
+            "/does-not-exist",
+            404,
+            {
+                "status": "not_found",
+                "message": "Threat report not found",
+                "details": None,
+                "documentationLink": f"{DOCS_URL}/404",
+            },
+        ),
+        (
+            "/duplicate",
+            409,
+            {
+                "status": "conflict",
+                "message": "User with this email already exists",
+                "details": None,
+                "documentationLink": f"{DOCS_URL}/409",
+            },
+        ),
+        (
+            "/custom",
+            503,
+            {
+                "status": "error",
+                "message": "Service unavailable.",
+                "details": None,
+                "documentationLink": f"{DOCS_URL}/503",
+            },
+        ),
+        (
+            "/custom?with_details=true",
+            503,
+            {
+                "status": "error",
+                "message": "Service unavailable.",
+                "details": {"field": "database", "reason": "Connection refused."},
+                "documentationLink": f"{DOCS_URL}/503",
+            },
+        ),
+        (
+            "/validated?page=first",
+            422,
+            {
+                "status": "validation_error",
+                "message": (
+                    "Input should be a valid integer, unable to parse string as an "
+                    "integer"
+                ),
+                "details": {"field": "page, in: query", "reason": "int_parsing"},
+                "documentationLink": f"{DOCS_URL}/422",
+            },
+        ),
+    ],
+)
+def test_error_response(
+    client: TestClient, path: str, status_code: int, body: dict[str, Any]
+) -> None:
+    """Test each handled error gets its status code and JSON error body."""
+    response = client.get(path)
+
+    assert response.status_code == status_code
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == body
+
+
+@pytest.mark.exception
+def test_internal_error_response(client: TestClient) -> None:
+    """Test an unhandled error gets a 500 response with the pre-serialized body."""
+    response = client.get("/internal")
+
+    assert response.status_code == 500
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == _INTERNAL_ERROR_BODY
+    assert response.json() == {
+        "status": "error",
+        "message": "An unexpected error occurred on the server.",
+        "documentationLink": f"{DOCS_URL}/500",
+    }
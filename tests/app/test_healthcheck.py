@@ -0,0 +1,160 @@
+"""Tests for the background health probe and endpoint in app.healthcheck module."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from app import healthcheck
+from app.healthcheck import (
+    _HEALTH_STATUS_MAX_AGE_SECONDS,
+    _HealthStatus,
+    check_health,
+    probe_health,
+    run_health_probe,
+)
+from toolkit.api.exceptions import CustomHTTPException
+
+
+class FakeService:
+    """Stand-in for the database or Redis manager, answering the queued results."""
+
+    def __init__(self, *results: bool | Exception) -> None:
+        self.results = list(results)
+        self.probed = 0
+
+    async def test_connection(self) -> bool:
+        """Answer the next queued result, repeating the last one once exhausted."""
+        self.probed += 1
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def health_status(monkeypatch: pytest.MonkeyPatch) -> _HealthStatus:
+    """Fixture to give each test a fresh health status, as before the first probe."""
+    health_status = _HealthStatus()
+    monkeypatch.setattr(healthcheck, "_health_status", health_status)
+    return health_status
+
+
+def patch_services(
+    monkeypatch: pytest.MonkeyPatch, db: FakeService, redis_manager: FakeService
+) -> None:
+    """Replace the database and Redis managers the probe uses."""
+    monkeypatch.setattr(healthcheck, "db", db)
+    monkeypatch.setattr(healthcheck, "redis_manager", redis_manager)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(["database", "redis"], [(True, True), (True, False)])
+async def test_probe_health(
+    monkeypatch: pytest.MonkeyPatch,
+    health_status: _HealthStatus,
+    database: bool,
+    redis: bool,
+) -> None:
+    """Test a probe records each service's availability, and when it was checked."""
+    patch_services(monkeypatch, FakeService(database), FakeService(redis))
+    before = time.monotonic()
+
+    await probe_health()
+
+    assert health_status.database is database
+    assert health_status.redis is redis
+    assert before <= health_status.checked_at <= time.monotonic()
+
+
+@pytest.mark.asyncio
+async def test_run_health_probe_survives_failures(
+    monkeypatch: pytest.MonkeyPatch, health_status: _HealthStatus
+) -> None:
+    """Test the probe loop logs an unexpected failure, and keeps probing."""
+    db = FakeService(RuntimeError("Unexpected failure"), True)
+    patch_services(monkeypatch, db, FakeService(True))
+    monkeypatch.setattr(
+        healthcheck, "settings", SimpleNamespace(health_check_interval_seconds=0)
+    )
+
+    async def wait_until_probed_twice() -> None:
+        while db.probed < 2:
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(run_health_probe())
+    try:
+        await asyncio.wait_for(wait_until_probed_twice(), timeout=1)
+    finally:
+        task.cancel()
+
+    assert health_status.database is True
+    assert health_status.redis is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.smoke
+async def test_check_health_fresh(health_status: _HealthStatus) -> None:
+    """Test fresh results of healthy services get the prebuilt OK body."""
+    health_status.database = health_status.redis = True
+    health_status.checked_at = time.monotonic()
+
+    response = await check_health()
+
+    assert response.status_code == 200
+    assert orjson.loads(response.body) == {
+        "database": True,
+        "redis": True,
+        "message": "Everything is Fine!",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.exception
+@pytest.mark.parametrize(
+    ["database", "redis", "message"],
+    [
+        (False, True, "Database not available"),
+        (True, False, "Redis not available"),
+    ],
+)
+async def test_check_health_unavailable(
+    health_status: _HealthStatus, database: bool, redis: bool, message: str
+) -> None:
+    """Test fresh results of an unavailable service get a 500 error."""
+    health_status.database = database
+    health_status.redis = redis
+    health_status.checked_at = time.monotonic()
+
+    with pytest.raises(CustomHTTPException) as exc_info:
+        await check_health()
+
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.message == message
+
+
+@pytest.mark.asyncio
+@pytest.mark.exception
+async def test_check_health_stale(health_status: _HealthStatus) -> None:
+    """Test results older than twice the probe interval get a 500 error."""
+    health_status.database = health_status.redis = True
+    health_status.checked_at = time.monotonic() - _HEALTH_STATUS_MAX_AGE_SECONDS - 1
+
+    with pytest.raises(CustomHTTPException) as exc_info:
+        await check_health()
+
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.message == "Health status is stale"
+
+
+@pytest.mark.asyncio
+@pytest.mark.exception
+async def test_check_health_before_first_probe(health_status: _HealthStatus) -> None:
+    """Test the status before the first probe counts as stale, not as healthy."""
+    with pytest.raises(CustomHTTPException) as exc_info:
+        await check_health()
+
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.message == "Health status is stale"
@@ -0,0 +1,258 @@
+"""Tests for the ThreatReportProducer class in app.threat.producer module."""
+
+import asyncio
+import logging
+from typing import Any
+
+import orjson
+import pytest
+from aio_pika import Message
+
+from app.threat.helpers.enums import ThreatType
+from app.threat.models import ThreatReport
+from app.threat.producer import (
+    _ATTACK_LOGS_CLAIM_CHECK_BYTES,
+    NEW_THREAT_REPORT_ROUTING_KEY,
+    ThreatReportProducer,
+    _encode_threat_report_message,
+)
+
+
+class FakeExchange:
+    """Stand-in for an aio_pika exchange, recording the published message bodies."""
+
+    def __init__(self) -> None:
+        self.published: list[bytes] = []
+        self.failures_left = 0
+
+    async def publish(self, message: Message, routing_key: str) -> None:
+        """Record the message body, or fail while failures are left."""
+        assert routing_key == NEW_THREAT_REPORT_ROUTING_KEY
+        if self.failures_left:
+            self.failures_left -= 1
+            raise ConnectionError("Publish failed")
+        self.published.append(message.body)
+
+
+class FakeConnection:
+    """Stand-in for an aio_pika connection, recording whether it was closed."""
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        """Mark the connection as closed."""
+        self.closed = True
+
+    async def channel(self) -> object:
+        """Open a stand-in channel."""
+        return object()
+
+
+class FakeRabbitmqManager:
+    """Stand-in for `AsyncRabbitmqManager`, failing the first connects on demand."""
+
+    def __init__(self, exchange: FakeExchange) -> None:
+        self.exchange = exchange
+        self.connections: list[FakeConnection] = []
+        self.connect_failures_left = 0
+
+    async def get_connection(self) -> FakeConnection:
+        """Open a connection, or fail while connect failures are left."""
+        if self.connect_failures_left:
+            self.connect_failures_left -= 1
+            raise ConnectionError("RabbitMQ is unreachable")
+        connection = FakeConnection()
+        self.connections.append(connection)
+        return connection
+
+    @staticmethod
+    async def get_channel(connection: FakeConnection) -> object:
+        """Open a channel on the connection."""
+        return await connection.channel()
+
+    async def declare_exchange(self, **kwargs: Any) -> FakeExchange:
+        """Declare the exchange."""
+        return self.exchange
+
+
+@pytest.fixture
+def exchange() -> FakeExchange:
+    """Fixture to create a fake exchange."""
+    return FakeExchange()
+
+
+@pytest.fixture
+def rabbitmq_manager(exchange: FakeExchange) -> FakeRabbitmqManager:
+    """Fixture to create a fake RabbitMQ manager, declaring the fake exchange."""
+    return FakeRabbitmqManager(exchange)
+
+
+@pytest.fixture
+def producer(rabbitmq_manager: FakeRabbitmqManager) -> ThreatReportProducer:
+    """Fixture to create a producer on the fake RabbitMQ manager."""
+    manager: Any = rabbitmq_manager
+    return ThreatReportProducer(rabbitmq_manager=manager)
+
+
+def make_threat_report(
+    indicator_address: str, attack_logs: str | None = None
+) -> ThreatReport:
+    """Create a transient threat report."""
+    return ThreatReport(
+        indicator_type=ThreatType.IP,
+        indicator_address=indicator_address,
+        full_name="John Doe",
+        email="john@example.com",
+        credibility=5,
+        attack_logs=attack_logs,
+    )
+
+
+def published_addresses(exchange: FakeExchange) -> list[str]:
+    """Return the indicator addresses of the published threat reports, in order."""
+    return [orjson.loads(body)["indicator_address"] for body in exchange.published]
+
+
+async def wait_until_published(producer: ThreatReportProducer) -> None:
+    """Wait for the enqueued reports to be handled, failing if publishing stalls."""
+    await asyncio.wait_for(producer._queue.join(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_enqueued_reports_are_published_as_a_batch(
+    producer: ThreatReportProducer,
+    exchange: FakeExchange,
+    rabbitmq_manager: FakeRabbitmqManager,
+) -> None:
+    """Test reports enqueued together are published together, over one connection."""
+    producer.start()
+    for address in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+        producer.enqueue_new_threat_report(make_threat_report(address))
+
+    await wait_until_published(producer)
+
+    assert published_addresses(exchange) == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+    assert len(rabbitmq_manager.connections) == 1
+    await producer.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.exception
+async def test_publish_failure_is_logged_and_publishing_continues(
+    producer: ThreatReportProducer,
+    exchange: FakeExchange,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failed batch is logged, and the next batch is still published."""
+    exchange.failures_left = 1
+    producer.start()
+
+    with caplog.at_level(logging.ERROR):
+        producer.enqueue_new_threat_report(make_threat_report("10.0.0.1"))
+        await wait_until_published(producer)
+    assert "Failed to send 1 new threat reports" in caplog.text
+
+    producer.enqueue_new_threat_report(make_threat_report("10.0.0.2"))
+    await wait_until_published(producer)
+
+    assert published_addresses(exchange) == ["10.0.0.2"]
+    await producer.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.exception
+async def test_failed_connect_is_retried_by_the_next_batch(
+    producer: ThreatReportProducer,
+    exchange: FakeExchange,
+    rabbitmq_manager: FakeRabbitmqManager,
+) -> None:
+    """Test a failed connect doesn't stop publishing, and the next batch reconnects."""
+    rabbitmq_manager.connect_failures_left = 1
+    with pytest.raises(ConnectionError):
+        await producer.connect()
+    producer.start()
+
+    rabbitmq_manager.connect_failures_left = 1
+    producer.enqueue_new_threat_report(make_threat_report("10.0.0.1"))
+    await wait_until_published(producer)
+    assert exchange.published == []
+
+    producer.enqueue_new_threat_report(make_threat_report("10.0.0.2"))
+    await wait_until_published(producer)
+
+    assert published_addresses(exchange) == ["10.0.0.2"]
+    assert producer._drain_task is not None
+    assert not producer._drain_task.done()
+    await producer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_the_queue(
+    producer: ThreatReportProducer,
+    exchange: FakeExchange,
+    rabbitmq_manager: FakeRabbitmqManager,
+) -> None:
+    """Test shutdown publishes the enqueued reports, then closes the connection."""
+    producer.start()
+    for address in ("10.0.0.1", "10.0.0.2"):
+        producer.enqueue_new_threat_report(make_threat_report(address))
+
+    await producer.shutdown()
+
+    assert published_addresses(exchange) == ["10.0.0.1", "10.0.0.2"]
+    assert producer._drain_task is None
+    assert all(connection.closed for connection in rabbitmq_manager.connections)
+
+
+@pytest.mark.asyncio
+async def test_close_keeps_publishing(
+    producer: ThreatReportProducer,
+    exchange: FakeExchange,
+    rabbitmq_manager: FakeRabbitmqManager,
+) -> None:
+    """Test closing the connection only makes the next batch reconnect."""
+    producer.start()
+    await producer.connect()
+
+    await producer.close()
+    producer.enqueue_new_threat_report(make_threat_report("10.0.0.1"))
+    await wait_until_published(producer)
+
+    assert published_addresses(exchange) == ["10.0.0.1"]
+    assert [connection.closed for connection in rabbitmq_manager.connections] == [
+        True,
+        False,
+    ]
+    await producer.shutdown()
+
+
+@pytest.mark.parametrize(
+    "attack_logs",
+    [None, "", "x" * _ATTACK_LOGS_CLAIM_CHECK_BYTES, "\u00e9" * 100_000],
+)
+def test_encode_message_keeps_attack_logs_up_to_the_cutoff(
+    attack_logs: str | None,
+) -> None:
+    """Test attack logs up to the claim-check cutoff are sent in the message."""
+    message = orjson.loads(
+        _encode_threat_report_message(make_threat_report("10.0.0.1", attack_logs))
+    )
+
+    assert message["attack_logs"] == attack_logs
+    assert "attack_logs_omitted" not in message
+
+
+@pytest.mark.parametrize(
+    "attack_logs",
+    ["x" * (_ATTACK_LOGS_CLAIM_CHECK_BYTES + 1), "\u00e9" * 200_000],
+)
+def test_encode_message_omits_attack_logs_past_the_cutoff(attack_logs: str) -> None:
+    """Test attack logs past the claim-check cutoff, in UTF-8 bytes, are left out."""
+    message = orjson.loads(
+        _encode_threat_report_message(make_threat_report("10.0.0.1", attack_logs))
+    )
+
+    assert message["attack_logs"] is None
+    assert message["attack_logs_omitted"] is True
+    assert message["indicator_address"] == "10.0.0.1"
@@ -0,0 +1,109 @@
+"""Tests for the JWT key caches of the Settings class in config.settings.base."""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+
+from config.settings import base
+from config.settings.base import Settings
+
+
+class CountingLoader:
+    """Wrap a key loader, counting the keys actually read from disk."""
+
+    def __init__(self, loader: Any) -> None:
+        self.loader = loader
+        self.calls = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Load the key, counting the call."""
+        self.calls += 1
+        return self.loader(*args, **kwargs)
+
+
+@pytest.fixture
+def key_paths(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> tuple[Path, Path]:
+    """Fixture to point the settings at a copy of the test keys, with empty caches."""
+    private_key_path = Path(shutil.copy(os.environ["JWT_PRIVATE_KEY_PATH"], tmp_path))
+    public_key_path = Path(shutil.copy(os.environ["JWT_PUBLIC_KEY_PATH"], tmp_path))
+    monkeypatch.setenv("JWT_PRIVATE_KEY_PATH", str(private_key_path))
+    monkeypatch.setenv("JWT_PUBLIC_KEY_PATH", str(public_key_path))
+    monkeypatch.setattr(base, "_private_keys", {})
+    monkeypatch.setattr(base, "_public_keys", {})
+    return private_key_path, public_key_path
+
+
+@pytest.fixture
+def loaders(monkeypatch: pytest.MonkeyPatch) -> tuple[CountingLoader, CountingLoader]:
+    """Fixture to count the private and public keys loaded from disk."""
+    private_loader = CountingLoader(serialization.load_ssh_private_key)
+    public_loader = CountingLoader(serialization.load_ssh_public_identity)
+    monkeypatch.setattr(serialization, "load_ssh_private_key", private_loader)
+    monkeypatch.setattr(serialization, "load_ssh_public_identity", public_loader)
+    return private_loader, public_loader
+
+
+def touch(path: Path) -> None:
+    """Move the file's modification time a second forward, as an edit would."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.smoke
+def test_rebuild_reuses_cached_keys(
+    key_paths: tuple[Path, Path], loaders: tuple[CountingLoader, CountingLoader]
+) -> None:
+    """Test building the settings again reuses the keys, without reloading them."""
+    settings = Settings()
+
+    rebuilt_settings = Settings()
+
+    assert rebuilt_settings.jwt_private_key is settings.jwt_private_key
+    assert rebuilt_settings.jwt_public_key is settings.jwt_public_key
+    assert [loader.calls for loader in loaders] == [1, 1]
+
+
+@pytest.mark.parametrize(["key_index", "expected_calls"], [(0, [2, 1]), (1, [1, 2])])
+def test_modified_key_is_reloaded(
+    key_paths: tuple[Path, Path],
+    loaders: tuple[CountingLoader, CountingLoader],
+    key_index: int,
+    expected_calls: list[int],
+) -> None:
+    """Test a key file whose modification time changed is loaded again."""
+    settings = Settings()
+    touch(key_paths[key_index])
+
+    rebuilt_settings = Settings()
+
+    assert [loader.calls for loader in loaders] == expected_calls
+    keys = (settings.jwt_private_key, settings.jwt_public_key)
+    rebuilt_keys = (rebuilt_settings.jwt_private_key, rebuilt_settings.jwt_public_key)
+    assert rebuilt_keys[key_index] is not keys[key_index]
+    assert rebuilt_keys[1 - key_index] is keys[1 - key_index]
+
+
+def test_changed_passphrase_is_not_served_from_cache(
+    monkeypatch: pytest.MonkeyPatch, key_paths: tuple[Path, Path]
+) -> None:
+    """Test a cached private key is not reused under a different passphrase."""
+    Settings()
+    monkeypatch.setenv("JWT_KEYS_PASSPHRASE", "wrong-passphrase")
+
+    with pytest.raises(ValueError):
+        Settings()
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize("key_index", [0, 1])
+def test_missing_key_raises(key_paths: tuple[Path, Path], key_index: int) -> None:
+    """Test a missing key file raises, even after the key was cached."""
+    Settings()
+    key_paths[key_index].unlink()
+
+    with pytest.raises(RuntimeError, match="keys are not generated yet"):
+        Settings()
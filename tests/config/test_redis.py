@@ -0,0 +1,106 @@
+"""Tests for the AsyncRedisConnection class in config.redis module."""
+
+import asyncio
+
+import pytest
+import redis.exceptions
+
+from config.redis import AsyncRedisConnection
+
+
+class FakeConnectionPool:
+    """Stand-in for a Redis connection pool, tracking the checked-out connections."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.in_use = 0
+        self.max_in_use = 0
+        self.released: list[object] = []
+
+    async def get_connection(self, command_name: str) -> object:
+        """Check a connection out, or fail while failures are left."""
+        await asyncio.sleep(0)
+        if self.failures:
+            self.failures -= 1
+            raise redis.exceptions.ConnectionError("Redis is unreachable")
+        self.in_use += 1
+        self.max_in_use = max(self.max_in_use, self.in_use)
+        return object()
+
+    async def release(self, connection: object) -> None:
+        """Hand a connection back to the pool."""
+        self.in_use -= 1
+        self.released.append(connection)
+
+
+class FakeRedis:
+    """Stand-in for a single connection Redis client."""
+
+    def __init__(self, is_available: bool) -> None:
+        self.is_available = is_available
+
+    async def ping(self) -> bool:
+        """Answer the PING, or fail if Redis is unavailable."""
+        if not self.is_available:
+            raise redis.exceptions.ConnectionError("Redis is unreachable")
+        return True
+
+
+def make_redis_manager(
+    max_connection: int = 32, single_connection: bool = False
+) -> AsyncRedisConnection:
+    """Create a Redis manager, without connecting."""
+    return AsyncRedisConnection(
+        host="localhost",
+        port=6379,
+        db=0,
+        password="password",
+        max_connection=max_connection,
+        single_connection=single_connection,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ["connections", "max_connection", "expected_opened"],
+    [(4, 32, 4), (8, 32, 8), (4, 2, 2)],
+)
+async def test_warm_up_pool(
+    connections: int, max_connection: int, expected_opened: int
+) -> None:
+    """Test warming up holds the connections at once, then releases them all."""
+    redis_manager = make_redis_manager(max_connection=max_connection)
+    connection_pool = FakeConnectionPool()
+    redis_manager.connection_pool = connection_pool
+
+    assert await redis_manager.warm_up(connections=connections) is True
+
+    assert connection_pool.max_in_use == expected_opened
+    assert len(connection_pool.released) == expected_opened
+    assert connection_pool.in_use == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.exception
+async def test_warm_up_pool_failure() -> None:
+    """Test a failed connection fails the warm-up, still releasing the others."""
+    redis_manager = make_redis_manager()
+    connection_pool = FakeConnectionPool(failures=1)
+    redis_manager.connection_pool = connection_pool
+
+    assert await redis_manager.warm_up(connections=4) is False
+
+    assert len(connection_pool.released) == 3
+    assert connection_pool.in_use == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_available", [True, False])
+async def test_warm_up_single_connection(is_available: bool) -> None:
+    """Test warming up in single connection mode pings, without creating a pool."""
+    redis_manager = make_redis_manager(single_connection=True)
+    redis_manager.redis_client = FakeRedis(is_available)
+
+    assert await redis_manager.warm_up() is is_available
+
+    assert redis_manager.connection_pool is None
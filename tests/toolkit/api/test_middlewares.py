@@ -0,0 +1,198 @@
+"""Tests for the RateLimitMiddleware class in toolkit.api.middlewares module."""
+
+from collections.abc import Iterable
+
+import pytest
+import redis.exceptions
+from fastapi_limiter import FastAPILimiter, default_identifier, http_default_callback
+from starlette.applications import Starlette
+from starlette.exceptions import HTTPException
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from toolkit.api.middlewares import RateLimitMiddleware
+
+LUA_SHA = "fake-sha"
+
+
+class FakeRedis:
+    """
+    Stand-in for the Redis client, counting requests like the limiter's Lua script.
+
+    The script must be loaded before `evalsha` succeeds, as after a Redis restart.
+    """
+
+    def __init__(self, window_remaining_milliseconds: int) -> None:
+        self.window_remaining_milliseconds = window_remaining_milliseconds
+        self.counts: dict[str, int] = {}
+        self.loaded_sha: str | None = None
+
+    async def script_load(self, script: str) -> str:
+        """Load the limiter's script."""
+        self.loaded_sha = LUA_SHA
+        return LUA_SHA
+
+    async def evalsha(
+        self, sha: str, numkeys: int, key: str, times: str, milliseconds: str
+    ) -> int:
+        """Count the request, returning the window's remaining time once over limit."""
+        if sha != self.loaded_sha:
+            raise redis.exceptions.NoScriptError("NOSCRIPT No matching script.")
+        if self.counts.get(key, 0) >= int(times):
+            return self.window_remaining_milliseconds
+        self.counts[key] = self.counts.get(key, 0) + 1
+        return 0
+
+
+async def ok(request: Request) -> PlainTextResponse:
+    """Respond with a plain OK."""
+    return PlainTextResponse("OK")
+
+
+async def client_host_identifier(request: Request) -> str:
+    """Identify the client by its host alone, unlike the default identifier."""
+    assert request.client is not None
+    return request.client.host
+
+
+def create_client(exclude_paths: Iterable[str | None] = ()) -> TestClient:
+    """Create a client of an app limited to 2 requests per second, per route."""
+    app = Starlette(
+        routes=[
+            Route("/threat", ok),
+            Route("/threat/{threat_id}", ok),
+            Route("/report", ok),
+            Route("/health", ok),
+        ],
+        middleware=[
+            Middleware(
+                RateLimitMiddleware, times=2, seconds=1, exclude_paths=exclude_paths
+            )
+        ],
+    )
+    return TestClient(app)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeRedis:
+    """Fixture to initialize `FastAPILimiter` with a fake Redis client."""
+    fake_redis = FakeRedis(window_remaining_milliseconds=1500)
+    monkeypatch.setattr(FastAPILimiter, "redis", fake_redis)
+    monkeypatch.setattr(FastAPILimiter, "prefix", "fastapi-limiter")
+    monkeypatch.setattr(FastAPILimiter, "identifier", default_identifier)
+    monkeypatch.setattr(FastAPILimiter, "http_callback", http_default_callback)
+    monkeypatch.setattr(FastAPILimiter, "lua_sha", "stale-sha")
+    return fake_redis
+
+
+@pytest.fixture
+def client(fake_redis: FakeRedis) -> TestClient:
+    """Fixture to create a client of the limited app, excluding `/health`."""
+    return create_client(exclude_paths=["/health", None])
+
+
+@pytest.mark.smoke
+def test_requests_within_limit(client: TestClient) -> None:
+    """Test requests within the limit reach the application."""
+    for _ in range(2):
+        response = client.get("/threat")
+
+        assert response.status_code == 200
+        assert response.text == "OK"
+
+
+@pytest.mark.exception
+def test_request_over_limit(client: TestClient) -> None:
+    """Test a request over the limit gets a 429 response, with Retry-After."""
+    for _ in range(2):
+        client.get("/threat")
+
+    response = client.get("/threat")
+
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Too Many Requests"}
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["retry-after"] == "2"
+
+
+def test_excluded_paths_are_not_limited(
+    client: TestClient, fake_redis: FakeRedis
+) -> None:
+    """Test requests to excluded paths are never counted, nor limited."""
+    for _ in range(5):
+        assert client.get("/health").status_code == 200
+
+    assert fake_redis.counts == {}
+    assert client.get("/threat").status_code == 200
+
+
+def test_script_is_reloaded(client: TestClient, fake_redis: FakeRedis) -> None:
+    """Test the limiter's script is loaded again when Redis doesn't know it."""
+    response = client.get("/threat")
+
+    assert response.status_code == 200
+    assert fake_redis.loaded_sha == FastAPILimiter.lua_sha == LUA_SHA
+
+
+@pytest.mark.exception
+def test_uninitialized_limiter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the middleware refuses requests before `FastAPILimiter.init`."""
+    monkeypatch.setattr(FastAPILimiter, "redis", None)
+    client = create_client()
+
+    with pytest.raises(RuntimeError, match=r"`FastAPILimiter\.init` must be called"):
+        client.get("/threat")
+
+
+def test_routes_are_limited_separately(client: TestClient) -> None:
+    """Test each route has its own window, as with the `RateLimiter` dependency."""
+    for _ in range(2):
+        client.get("/threat")
+
+    assert client.get("/threat").status_code == 429
+    assert client.get("/report").status_code == 200
+
+
+def test_path_parameters_share_the_route_window(
+    monkeypatch: pytest.MonkeyPatch, client: TestClient, fake_redis: FakeRedis
+) -> None:
+    """Test requests to one route share its window, whatever the path parameters."""
+    monkeypatch.setattr(FastAPILimiter, "identifier", client_host_identifier)
+
+    assert client.get("/threat/1").status_code == 200
+    assert client.get("/threat/2").status_code == 200
+    assert client.get("/threat/3").status_code == 429
+    assert len(fake_redis.counts) == 1
+
+
+def test_unmatched_paths_are_not_limited(
+    client: TestClient, fake_redis: FakeRedis
+) -> None:
+    """Test requests matching no route are passed through, without being counted."""
+    for _ in range(3):
+        assert client.get("/unknown").status_code == 404
+
+    assert fake_redis.counts == {}
+
+
+@pytest.mark.exception
+def test_configured_callback(
+    monkeypatch: pytest.MonkeyPatch, client: TestClient
+) -> None:
+    """Test a request over the limit gets the callback set by `FastAPILimiter.init`."""
+
+    async def http_callback(request: Request, response: Response, pexpire: int) -> None:
+        raise HTTPException(503, "Slow down", headers={"X-Retry-In": str(pexpire)})
+
+    monkeypatch.setattr(FastAPILimiter, "http_callback", http_callback)
+    for _ in range(2):
+        client.get("/threat")
+
+    response = client.get("/threat")
+
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Slow down"}
+    assert response.headers["x-retry-in"] == "1500"
@@ -1,31 +1,61 @@
 """Tests for the Pagination class in toolkit.api.pagination module."""
 
-from unittest.mock import MagicMock
+from typing import Any, Self
 
 import pytest
-from sqlalchemy.orm import Query
+from sqlalchemy import ColumnElement, Integer, column, select, table
 
-from toolkit.api.pagination import PageNumberPagination
+from toolkit.api.pagination import KeysetPagination, PageNumberPagination
+
+
+class FakeQuery:
+    """Minimal stand-in for a SQLAlchemy Query, recording the applied clauses."""
+
+    def __init__(self) -> None:
+        self.offset_value: int | None = None
+        self.limit_value: int | None = None
+        self.filter_value: ColumnElement[bool] | None = None
+        self.order_by_value: Any = None
+
+    def filter(self, criterion: ColumnElement[bool]) -> Self:
+        """Record the filter criterion and return the query, for chaining."""
+        self.filter_value = criterion
+        return self
+
+    def order_by(self, order_column: Any) -> Self:
+        """Record the ordering column and return the query, for chaining."""
+        self.order_by_value = order_column
+        return self
+
+    def offset(self, offset: int) -> Self:
+        """Record the offset and return the query, for chaining."""
+        self.offset_value = offset
+        return self
+
+    def limit(self, limit: int) -> Self:
+        """Record the limit and return the query, for chaining."""
+        self.limit_value = limit
+        return self
 
 
 @pytest.fixture
-def mock_query() -> MagicMock:
-    """Fixture to create a mock SQLAlchemy Query object."""
-    return MagicMock(spec=Query)
+def fake_query() -> FakeQuery:
+    """Fixture to create a fake SQLAlchemy Query object."""
+    return FakeQuery()
 
 
 @pytest.mark.parametrize(
     ["page", "page_size"],
     [(1, 10), (2, 10), (1, 20), (2, 20), (3, 20), (4, 20)],
 )
-def test_paginate(mock_query: MagicMock, page: int, page_size: int) -> None:
+def test_paginate(fake_query: FakeQuery, page: int, page_size: int) -> None:
     """
-    Fixture to create a mock SQLAlchemy Query object.
+    Test paginating a query applies the page's offset and the page size as limit.
 
     Parameters
     ----------
-    mock_query : MagicMock
-        A mock SQLAlchemy Query object.
+    fake_query : FakeQuery
+        A fake SQLAlchemy Query object.
     page : int
         Page number.
     page_size : int
@@ -35,13 +65,99 @@ def test_paginate(mock_query: MagicMock, page: int, page_size: int) -> None:
     expected_offset = (page - 1) * page_size
     expected_limit = page_size
 
-    # Mock the chainable methods
-    mock_query.offset.return_value = mock_query
-    mock_query.limit.return_value = mock_query
+    query: Any = fake_query
+    result = PageNumberPagination.paginate(query, page, page_size)
+
+    assert fake_query.offset_value == expected_offset
+    assert fake_query.limit_value == expected_limit
+
+    assert result is fake_query
+
+
+def test_paginate_select() -> None:
+    """Test paginating a 2.0-style select statement applies offset and limit."""
+    statement = select(table("threat_report", column("id", Integer)))
+
+    result = PageNumberPagination.paginate(statement, 3, 20)
+
+    compiled = result.compile(compile_kwargs={"literal_binds": True})
+    assert str(compiled).endswith("LIMIT 20 OFFSET 40")
+
+
+@pytest.mark.parametrize(["after", "page_size"], [(10, 10), (250, 20)])
+def test_paginate_keyset(fake_query: FakeQuery, after: int, page_size: int) -> None:
+    """
+    Test keyset pagination seeks after the given key, in key order.
+
+    Parameters
+    ----------
+    fake_query : FakeQuery
+        A fake SQLAlchemy Query object.
+    after : int
+        The key of the previous page's last item.
+    page_size : int
+        Page size.
+    """
+    id_column: Any = column("id", Integer)
+
+    query: Any = fake_query
+    result = KeysetPagination.paginate(query, after, page_size, id_column)
+
+    assert fake_query.filter_value is not None
+    criterion = fake_query.filter_value.compile(compile_kwargs={"literal_binds": True})
+    assert str(criterion) == f"id > {after}"
+    assert fake_query.order_by_value is id_column
+    assert fake_query.limit_value == page_size
+    assert fake_query.offset_value is None
+
+    assert result is fake_query
+
+
+def test_paginate_keyset_first_page(fake_query: FakeQuery) -> None:
+    """Test keyset pagination of the first page doesn't filter the query."""
+    id_column: Any = column("id", Integer)
+
+    query: Any = fake_query
+    KeysetPagination.paginate(query, None, 10, id_column)
+
+    assert fake_query.filter_value is None
+    assert fake_query.order_by_value is id_column
+    assert fake_query.limit_value == 10
+
+
+@pytest.mark.parametrize("last_key", [1, 42, 10**12])
+def test_cursor_round_trip(last_key: int) -> None:
+    """Test a cursor decodes back into the key it was encoded from."""
+    cursor = KeysetPagination.encode_cursor(last_key)
+
+    assert KeysetPagination.decode_cursor(cursor) == last_key
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "YWJj"])
+def test_decode_invalid_cursor(cursor: str) -> None:
+    """Test decoding a malformed cursor raises `ValueError`."""
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        KeysetPagination.decode_cursor(cursor)
+
+
+def test_paginate_with_total() -> None:
+    """Test the total count is selected as a window column of the paginated page."""
+    statement = select(table("threat_report", column("id", Integer)))
+
+    result = PageNumberPagination.paginate_with_total(statement, 2, 10)
+
+    compiled = str(result.compile(compile_kwargs={"literal_binds": True}))
+    assert "count(*) OVER () AS total_count" in compiled
+    assert compiled.endswith("LIMIT 10 OFFSET 10")
+
+
+def test_split_total() -> None:
+    """Test splitting the rows of a page into its items and the total count."""
+    rows: Any = [("first", 42), ("second", 42)]
 
-    result = PageNumberPagination.paginate(mock_query, page, page_size)
+    assert PageNumberPagination.split_total(rows) == (["first", "second"], 42)
 
-    mock_query.offset.assert_called_once_with(expected_offset)
-    mock_query.limit.assert_called_once_with(expected_limit)
 
-    assert result == mock_query
+def test_split_total_past_last_page() -> None:
+    """Test a page past the last one leaves the total unknown, rather than 0."""
+    assert PageNumberPagination.split_total([]) == ([], None)
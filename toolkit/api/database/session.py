@@ -4,21 +4,19 @@ from collections.abc import AsyncGenerator
 
 from fastapi import status
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.base import db, logger
 from toolkit.api.enums import HTTPStatusDoc, Messages, Status
 from toolkit.api.exceptions import CustomHTTPException
 
 
-async def get_async_db_session() -> (
-    AsyncGenerator[async_scoped_session[AsyncSession], None]
-):
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency injection module for async database session.
 
     This module provides an asynchronous generator function `get_async_db_session
-    for injecting an async scoped database session into FastAPI endpoints. It manages
+    for injecting an async database session into FastAPI endpoints. It manages
     database transactions, logging errors, and raising custom HTTP exceptions in
     case of database-related or unexpected issues.
 
@@ -30,8 +28,8 @@ async def get_async_db_session() -> (
 
     Yields
     ------
-    AsyncGenerator[async_scoped_session[AsyncSession], None]
-        The async scoped session object that can be used for database operations
+    AsyncGenerator[AsyncSession, None]
+        A session of its own for the request, to be used for database operations
         within the FastAPI route or service.
 
     Examples
@@ -44,19 +42,19 @@ Annotated[AsyncSession, Depends(get_async_db_session)]):
             # Interact with the database using `db_session`
             pass
     """
-    db_session = db.get_session()
-    try:
-        yield db_session
-    except CustomHTTPException:
-        raise
-    except SQLAlchemyError:
-        await db_session.rollback()
-        logger.error("Database error occurred", exc_info=True)
-        raise CustomHTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            status=Status.ERROR,
-            message=Messages.INTERNAL_SERVER_ERROR,
-            documentation_link=HTTPStatusDoc.HTTP_STATUS_500,
-        )
-    finally:
-        await db_session.close()
+    # The dependency is already scoped to the request, so a plain session from the
+    # factory suffices; `async with` closes it once the request is done.
+    async with db.get_session_factory()() as db_session:
+        try:
+            yield db_session
+        except CustomHTTPException:
+            raise
+        except SQLAlchemyError:
+            await db_session.rollback()
+            logger.error("Database error occurred", exc_info=True)
+            raise CustomHTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status=Status.ERROR,
+                message=Messages.INTERNAL_SERVER_ERROR,
+                documentation_link=HTTPStatusDoc.HTTP_STATUS_500,
+            )
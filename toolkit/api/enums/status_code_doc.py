@@ -66,6 +66,4 @@ class HTTPStatusDoc(StrEnum):
     HTTP_STATUS_507 = "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/507"
     HTTP_STATUS_508 = "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/508"
     HTTP_STATUS_510 = "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/510"
-    HTTP_STATUS_511 = (
-        "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/511HTTP_"
-    )
+    HTTP_STATUS_511 = "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/511"
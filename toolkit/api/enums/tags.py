@@ -1,10 +1,10 @@
-"""Define enumeration constants for OpenAPI tags."""
+"""Define constants for OpenAPI tags."""
 
-from enum import StrEnum
+from typing import Final
 
 
-class OpenAPITags(StrEnum):
-    """Define enumeration constants for OpenAPI tags."""
+class OpenAPITags:
+    """Namespace of the OpenAPI tags, as plain strings passed to route `tags=`."""
 
-    AUTH = "Auth"
-    THREAT_REPORTS = "Threat Reports"
+    AUTH: Final[str] = "Auth"
+    THREAT_REPORTS: Final[str] = "Threat Reports"
@@ -3,11 +3,12 @@ from .custom_exceptions import (
     DuplicateResourceError,
     UnauthorizedError,
 )
-from .http_exceptions import CustomHTTPException
+from .http_exceptions import CustomHTTPException, HTTPErrorDetails
 
 __all__ = [
     "CustomHTTPException",
     "DoesNotExistError",
     "DuplicateResourceError",
+    "HTTPErrorDetails",
     "UnauthorizedError",
 ]
@@ -1,5 +1,6 @@
 """Define custom HTTPExceptions for fastapi applications."""
 
+from dataclasses import dataclass
 from typing import Optional
 
 from fastapi import HTTPException
@@ -7,6 +8,23 @@ from fastapi import HTTPException
 from toolkit.api.enums import HTTPStatusDoc, Status
 
 
+@dataclass(slots=True, frozen=True)
+class HTTPErrorDetails:
+    """
+    The field and reason of an HTTP error, serialized as the `details` object.
+
+    Attributes
+    ----------
+    field : str
+        The name of the parameter or field associated with the error.
+    reason : str
+        A detailed explanation of why the parameter or field is invalid.
+    """
+
+    field: str
+    reason: str
+
+
 class CustomHTTPException(HTTPException):
     """
     Custom exception class for representing HTTP errors in fastapi applications.
@@ -45,11 +63,9 @@ class CustomHTTPException(HTTPException):
         self.status = status
         self.message = message
         self.documentation_link = documentation_link
-        self.details = None
-
-        if (reason is not None) and (field is not None):
-            self.details = {
-                "field": field,
-                "reason": reason,
-            }
+        self.details = (
+            HTTPErrorDetails(field, reason)
+            if reason is not None and field is not None
+            else None
+        )
         super().__init__(status_code, headers)
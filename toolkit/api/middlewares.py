@@ -0,0 +1,152 @@
+"""Module provides ASGI middlewares for FastAPI applications."""
+
+from collections.abc import Iterable
+
+import orjson
+import redis.exceptions
+from fastapi_limiter import FastAPILimiter
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class RateLimitMiddleware:
+    """
+    Application-wide rate limiting, as a pure ASGI middleware.
+
+    This applies the same fixed-window limit, Lua script, client identifier, and
+    HTTP callback as `fastapi_limiter.depends.RateLimiter`, configured through
+    `FastAPILimiter.init`, but runs once in front of the application instead of as a
+    dependency resolved on every route. As with the dependency, each client gets a
+    separate window per route; requests matching no route are passed through, and
+    excluded paths (e.g. health checks) never touch Redis.
+
+    Being outside FastAPI's exception middleware, an `HTTPException` raised by the
+    callback is rendered here, as FastAPI's default handler would render it.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        times: int,
+        milliseconds: int = 0,
+        seconds: int = 0,
+        minutes: int = 0,
+        exclude_paths: Iterable[str | None] = (),
+    ) -> None:
+        """
+        Initialize the `RateLimitMiddleware`.
+
+        Parameters
+        ----------
+        app : ASGIApp
+            The wrapped ASGI application.
+        times : int
+            The number of requests allowed per client within the window.
+        milliseconds, seconds, minutes : int, optional
+            The window length, summed across the units (default is 0 for each).
+        exclude_paths : Iterable[str | None], optional
+            Request paths that are never rate limited; None entries, such as a
+            disabled docs URL, are ignored (default is none).
+        """
+        self.app = app
+        self.times = str(times)
+        self.milliseconds = str(milliseconds + 1000 * seconds + 60000 * minutes)
+        self.exclude_paths = frozenset(path for path in exclude_paths if path)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Reject the request through the limiter's callback if over the limit."""
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if not (
+            FastAPILimiter.redis
+            and FastAPILimiter.identifier
+            and FastAPILimiter.http_callback
+        ):
+            raise RuntimeError("`FastAPILimiter.init` must be called on startup.")
+
+        route_index = self._match_route(scope)
+        if route_index is None:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        rate_key = await FastAPILimiter.identifier(request)
+        pexpire = await self._check(
+            key=f"{FastAPILimiter.prefix}:{rate_key}:{route_index}:middleware"
+        )
+        if pexpire != 0:
+            try:
+                await FastAPILimiter.http_callback(request, Response(), pexpire)
+            except HTTPException as exc:
+                response = Response(
+                    content=orjson.dumps({"detail": exc.detail}),
+                    status_code=exc.status_code,
+                    headers=exc.headers,
+                    media_type="application/json",
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _match_route(scope: Scope) -> int | None:
+        """
+        Find the application route the request is routed to.
+
+        The route's index, rather than the raw path, keys the client's window, so
+        every value of a path parameter shares the route's window.
+
+        Parameters
+        ----------
+        scope : Scope
+            The ASGI scope of the request.
+
+        Returns
+        -------
+        int or None
+            The index of the fully matching route, or None if no route matches.
+        """
+        for index, route in enumerate(scope["app"].routes):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return index
+        return None
+
+    async def _check(self, key: str) -> int:
+        """
+        Count a request against the limit.
+
+        Parameters
+        ----------
+        key : str
+            The Redis key of the client's window.
+
+        Returns
+        -------
+        int
+            0 if the request is allowed, otherwise the window's remaining milliseconds.
+        """
+        redis_client = FastAPILimiter.redis
+        assert redis_client is not None
+        try:
+            return int(
+                await redis_client.evalsha(
+                    FastAPILimiter.lua_sha, 1, key, self.times, self.milliseconds
+                )
+            )
+        except redis.exceptions.NoScriptError:
+            FastAPILimiter.lua_sha = await redis_client.script_load(
+                FastAPILimiter.lua_script
+            )
+            return int(
+                await redis_client.evalsha(
+                    FastAPILimiter.lua_sha, 1, key, self.times, self.milliseconds
+                )
+            )
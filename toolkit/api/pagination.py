@@ -1,22 +1,30 @@
 """Module provides classes for pagination helper for SQLAlchemy queries."""
 
-from typing import Any
+import base64
+import binascii
+from collections.abc import Sequence
+from typing import Any, TypeVar
 
-from sqlalchemy.orm import Query
+from sqlalchemy import Row, Select, func
+from sqlalchemy.orm import InstrumentedAttribute, Query
+
+# Legacy `Query` objects and 2.0-style `select()` statements share the pagination
+# methods, so both are accepted and returned as is.
+_Q = TypeVar("_Q", Query[Any], Select[Any])
 
 
 class PageNumberPagination:
     """Pagination helper class for SQLAlchemy queries."""
 
     @staticmethod
-    def paginate(query: Query[Any], page: int, page_size: int) -> Query[Any]:
+    def paginate(query: _Q, page: int, page_size: int) -> _Q:
         """
         Apply pagination to a SQLAlchemy query.
 
         Parameters
         ----------
-        query : sqlalchemy.orm.query.Query
-            The SQLAlchemy query to paginate.
+        query : sqlalchemy.orm.query.Query or sqlalchemy.Select
+            The SQLAlchemy query or select statement to paginate.
         page : int
             The current page number (1-indexed).
         page_size : int
@@ -24,7 +32,138 @@ class PageNumberPagination:
 
         Returns
         -------
-        sqlalchemy.orm.query.Query
-            The paginated SQLAlchemy query.
+        sqlalchemy.orm.query.Query or sqlalchemy.Select
+            The paginated SQLAlchemy query or select statement.
         """
         return query.offset((page - 1) * page_size).limit(page_size)
+
+    @staticmethod
+    def paginate_with_total(
+        statement: Select[Any], page: int, page_size: int
+    ) -> Select[Any]:
+        """
+        Apply pagination to a select statement, selecting the total count alongside.
+
+        A `COUNT(*) OVER ()` window column carries the number of rows matching the
+        statement before pagination, so the page and the total for the `Pagination`
+        schema come from a single query, instead of a second `SELECT COUNT(*)`.
+
+        Parameters
+        ----------
+        statement : sqlalchemy.Select
+            The select statement to paginate.
+        page : int
+            The current page number (1-indexed).
+        page_size : int
+            The number of items per page.
+
+        Returns
+        -------
+        sqlalchemy.Select
+            The paginated select statement, with the total count as the last column.
+        """
+        statement = statement.add_columns(func.count().over().label("total_count"))
+        return PageNumberPagination.paginate(statement, page, page_size)
+
+    @staticmethod
+    def split_total(rows: Sequence[Row[Any]]) -> tuple[list[Any], int | None]:
+        """
+        Split the rows of a `paginate_with_total` statement into items and total.
+
+        Parameters
+        ----------
+        rows : Sequence[sqlalchemy.Row]
+            The fetched rows, each ending with the total count column.
+
+        Returns
+        -------
+        tuple[list[Any], int or None]
+            The first selected element of each row, and the total count. A page past
+            the last one has no rows to carry the total, so it is None, and the
+            caller falls back to a `SELECT COUNT(*)` of the unpaginated statement.
+        """
+        if not rows:
+            return [], None
+        return [row[0] for row in rows], rows[0][-1]
+
+
+class KeysetPagination:
+    """
+    Keyset (seek) pagination helper class for SQLAlchemy queries.
+
+    Instead of skipping `(page - 1) * page_size` rows, each page starts right after
+    the last key of the previous one, so the database seeks straight to it through
+    the key's index, and deep pages cost as much as the first one.
+    """
+
+    @staticmethod
+    def paginate(
+        query: _Q,
+        after: int | None,
+        page_size: int,
+        order_column: InstrumentedAttribute[Any],
+    ) -> _Q:
+        """
+        Apply keyset pagination to a SQLAlchemy query.
+
+        Parameters
+        ----------
+        query : sqlalchemy.orm.query.Query or sqlalchemy.Select
+            The SQLAlchemy query or select statement to paginate.
+        after : int or None
+            The key of the last item of the previous page, or None for the first page.
+        page_size : int
+            The number of items per page.
+        order_column : sqlalchemy.orm.InstrumentedAttribute
+            The unique, indexed column to order and seek by, typically the id.
+
+        Returns
+        -------
+        sqlalchemy.orm.query.Query or sqlalchemy.Select
+            The paginated SQLAlchemy query or select statement.
+        """
+        if after is not None:
+            query = query.filter(order_column > after)
+        return query.order_by(order_column).limit(page_size)
+
+    @staticmethod
+    def encode_cursor(last_key: int) -> str:
+        """
+        Encode the key of a page's last item into an opaque cursor.
+
+        Parameters
+        ----------
+        last_key : int
+            The key of the last item of the page.
+
+        Returns
+        -------
+        str
+            The URL-safe cursor for the next page.
+        """
+        return base64.urlsafe_b64encode(str(last_key).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> int:
+        """
+        Decode a cursor back into the key of the previous page's last item.
+
+        Parameters
+        ----------
+        cursor : str
+            The cursor returned with the previous page.
+
+        Returns
+        -------
+        int
+            The key to seek after.
+
+        Raises
+        ------
+        ValueError
+            If the cursor is malformed.
+        """
+        try:
+            return int(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError) as err:
+            raise ValueError(f"Invalid pagination cursor: {cursor!r}") from err
@@ -1,6 +1,29 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base import APIErrorResponse, APIResponse, APISuccessResponse, BaseSchema
-from .mixins import CommonMixins
-from .pagination import Pagination
+
+if TYPE_CHECKING:
+    from .mixins import CommonMixins
+    from .pagination import Pagination
+
+# Schemas imported, and so built, on first access only.
+_LAZY_SCHEMAS = {
+    "CommonMixins": ".mixins",
+    "Pagination": ".pagination",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the lazily built schemas on first access."""
+    try:
+        module_name = _LAZY_SCHEMAS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "APIErrorResponse",
@@ -1,38 +1,60 @@
 """Module defining Pydantic models for error handling in API responses."""
 
+from typing import Any
+
 from pydantic import ConfigDict
-from pydantic.alias_generators import to_camel
 
+from toolkit.api.enums import HTTPStatusDoc
 from toolkit.api.schemas.base import APIErrorResponse
 
 
+def _build_example(
+    status: str, message: str, code: int, details: dict[str, str] | None = None
+) -> dict[str, Any]:
+    """
+    Build the OpenAPI example of an error response.
+
+    Parameters
+    ----------
+    status : str
+        The status of the error response.
+    message : str
+        The error message.
+    code : int
+        The HTTP status code, used to resolve the documentation link.
+    details : dict[str, str] | None, optional
+        The example error details, with `field` and `reason` keys, by default None.
+
+    Returns
+    -------
+    dict[str, Any]
+        The `json_schema_extra` of the error schema, holding the single example.
+    """
+    example: dict[str, Any] = {
+        "status": status,
+        "message": message,
+        "documentationLink": HTTPStatusDoc[f"HTTP_STATUS_{code}"].value,
+    }
+    if details is not None:
+        example["details"] = details
+    return {"examples": [example]}
+
+
 class BadRequest(APIErrorResponse):
     """Represents a 400 Bad Request error."""
 
     model_config = ConfigDict(
-        allow_inf_nan=True,
-        from_attributes=True,
-        alias_generator=to_camel,
-        populate_by_name=True,
-        strict=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "status": "error",
-                    "message": "Bad request. Invalid or missing parameters.",
-                    "documentationLink": (
-                        "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/400"
-                    ),
-                    "details": {
-                        "field": "parameter_name",
-                        "reason": (
-                            "Description of the reason why the parameter is invalid "
-                            "or missing."
-                        ),
-                    },
-                }
-            ]
-        },
+        json_schema_extra=_build_example(
+            "error",
+            "Bad request. Invalid or missing parameters.",
+            400,
+            details={
+                "field": "parameter_name",
+                "reason": (
+                    "Description of the reason why the parameter is invalid or missing."
+                ),
+            },
+        ),
     )
 
 
@@ -40,22 +62,9 @@ class Unauthorized(APIErrorResponse):
     """Represents a 401 Unauthorized error."""
 
     model_config = ConfigDict(
-        allow_inf_nan=True,
-        from_attributes=True,
-        alias_generator=to_camel,
-        populate_by_name=True,
-        strict=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "status": "unauthorized",
-                    "message": "Unauthorized. User is not authenticated.",
-                    "documentationLink": (
-                        "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/401"
-                    ),
-                }
-            ]
-        },
+        json_schema_extra=_build_example(
+            "unauthorized", "Unauthorized. User is not authenticated.", 401
+        ),
     )
 
 
@@ -63,22 +72,9 @@ class Forbidden(APIErrorResponse):
     """Represents a 403 Forbidden error."""
 
     model_config = ConfigDict(
-        allow_inf_nan=True,
-        from_attributes=True,
-        alias_generator=to_camel,
-        populate_by_name=True,
-        strict=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "status": "forbidden",
-                    "message": "User does not have permission to access this resource.",
-                    "documentationLink": (
-                        "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/403"
-                    ),
-                }
-            ]
-        },
+        json_schema_extra=_build_example(
+            "forbidden", "User does not have permission to access this resource.", 403
+        ),
     )
 
 
@@ -86,22 +82,9 @@ class NotFound(APIErrorResponse):
     """Represents a 404 Not Found error."""
 
     model_config = ConfigDict(
-        allow_inf_nan=True,
-        from_attributes=True,
-        alias_generator=to_camel,
-        populate_by_name=True,
-        strict=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "status": "not_found",
-                    "message": "Not Found. The requested resource does not exist.",
-                    "documentationLink": (
-                        "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/404"
-                    ),
-                }
-            ]
-        },
+        json_schema_extra=_build_example(
+            "not_found", "Not Found. The requested resource does not exist.", 404
+        ),
     )
 
 
@@ -109,25 +92,11 @@ class Conflict(APIErrorResponse):
     """Represents a 409 Conflict error."""
 
     model_config = ConfigDict(
-        allow_inf_nan=True,
-        from_attributes=True,
-        alias_generator=to_camel,
-        populate_by_name=True,
-        strict=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "status": "conflict",
-                    "message": (
-                        "Conflict. The request conflicts with the current state of "
-                        "the server."
-                    ),
-                    "documentationLink": (
-                        "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/409"
-                    ),
-                }
-            ]
-        },
+        json_schema_extra=_build_example(
+            "conflict",
+            "Conflict. The request conflicts with the current state of the server.",
+            409,
+        ),
     )
 
 
@@ -135,29 +104,18 @@ class UnprocessableEntity(APIErrorResponse):
     """Represents a 422 Unprocessable Entity error."""
 
     model_config = ConfigDict(
-        allow_inf_nan=True,
-        from_attributes=True,
-        alias_generator=to_camel,
-        populate_by_name=True,
-        strict=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "status": "validation_error",
-                    "message": (
-                        "Unprocessable Entity. The request is well-formed but unable "
-                        "to be processed due to semantic errors."
-                    ),
-                    "documentationLink": (
-                        "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/422"
-                    ),
-                    "details": {
-                        "field": "entity_name",
-                        "reason": "Description of the semantic error.",
-                    },
-                }
-            ]
-        },
+        json_schema_extra=_build_example(
+            "validation_error",
+            (
+                "Unprocessable Entity. The request is well-formed but unable to be "
+                "processed due to semantic errors."
+            ),
+            422,
+            details={
+                "field": "entity_name",
+                "reason": "Description of the semantic error.",
+            },
+        ),
     )
 
 
@@ -165,23 +123,12 @@ class InternalServerError(APIErrorResponse):
     """Represents a 500 Internal Server Error."""
 
     model_config = ConfigDict(
-        allow_inf_nan=True,
-        from_attributes=True,
-        alias_generator=to_camel,
-        populate_by_name=True,
-        strict=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "status": "error",
-                    "message": (
-                        "Internal Server Error. An unexpected condition was "
-                        "encountered on the server."
-                    ),
-                    "documentationLink": (
-                        "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/500"
-                    ),
-                }
-            ]
-        },
+        json_schema_extra=_build_example(
+            "error",
+            (
+                "Internal Server Error. An unexpected condition was encountered on "
+                "the server."
+            ),
+            500,
+        ),
     )
@@ -30,3 +30,7 @@ class Pagination(BaseSchema):
     previous_page: Annotated[
         str | None, Field(description="Endpoint or the Url for the previous page.")
     ] = None
+    next_cursor: Annotated[
+        str | None,
+        Field(description="Cursor for the next page, with keyset pagination."),
+    ] = None
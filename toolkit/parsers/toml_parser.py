@@ -1,10 +1,9 @@
 """Contains the TOMLParser class for parsing TOML files."""
 
 import logging
+import tomllib
 from typing import Any
 
-import tomlkit
-
 from .base import Parser
 from .helpers.exceptions import TOMLParseError
 
@@ -25,9 +24,9 @@ class TOMLParser(Parser):
         """
         try:
             with self.file_path.open(mode="rb") as file:
-                content = tomlkit.load(file)
+                content = tomllib.load(file)
             return content
-        except tomlkit.exceptions.ParseError as err:
+        except tomllib.TOMLDecodeError as err:
             msg = f"Syntax Error in: `{self.file_path}`!"
             logger.error(msg, exc_info=True)
             raise TOMLParseError(msg) from err